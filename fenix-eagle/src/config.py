@@ -17,6 +17,18 @@ class Settings(BaseSettings):
     anthropic_api_key: str | None = None
     crawl4ai_api_key: str | None = None
 
+    # OpenAI request limits (match the account tier)
+    openai_max_concurrency: int = 5
+    openai_requests_per_minute: int = 60
+    openai_tokens_per_minute: int = 40000
+
+    # Email generation models: tenders from the value threshold up get the premium model
+    openai_email_model: str = "gpt-4o-mini"
+    openai_premium_email_model: str = "gpt-4o"
+    openai_premium_value_threshold: float = 100_000
+    # Comma-separated location fragments whose tenders get the template email instead of a completion
+    ai_email_location_blocklist: str = ""
+
     # Google Sheets Integration
     google_credentials_file: str | None = None
     google_sheet_id: str | None = None
@@ -27,6 +39,7 @@ class Settings(BaseSettings):
 
     # SAM.gov API
     sam_gov_api_key: str | None = None
+    sam_gov_keywords_per_query: int = 0  # >0 splits keywords into concurrent queries; 0 = one OR query
 
     # Shovels AI API
     shovels_ai_api_key: str | None = None
@@ -61,6 +74,7 @@ class Settings(BaseSettings):
     default_scraping_interval: int = 3600  # seconds
     max_concurrent_scraping_jobs: int = 5
     scraping_timeout: int = 300  # seconds
+    scraper_include_raw_data: bool = True  # keep the full NYC DOB / Shovels / BuildingConnected row in extracted_data
 
     # Browser Configuration (Playwright)
     browser_headless: bool = True
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from uuid import uuid4
 
 from sqlalchemy import (
@@ -9,8 +10,10 @@ from sqlalchemy import (
     String,
     Text,
     create_engine,
+    make_url,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.sql import func
@@ -148,7 +151,7 @@ class GeneratedEmail(Base):
     prompt_version = Column(String(50))  # For tracking prompt changes
     contact_info = Column(JSONB, default=dict)  # Recipient details
     tender_info = Column(JSONB, default=dict)  # Snapshot of tender data used
-    status = Column(String(20), default="generated", index=True)  # generated/sent/failed
+    status = Column(String(20), default="generated", index=True)  # generated/fallback/sent/failed
     email_metadata = Column(JSONB, default=dict)  # Additional data
 
 
@@ -157,6 +160,22 @@ engine = create_engine(settings.database_url)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+@lru_cache(maxsize=1)
+def _async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """Async session factory on the asyncpg driver, same database as SessionLocal
+
+    Built on first use, so importers that never open an async session (e.g. Celery workers)
+    do not need asyncpg installed.
+    """
+    url = make_url(settings.database_url).set(drivername="postgresql+asyncpg")
+    return async_sessionmaker(create_async_engine(url), expire_on_commit=False)
+
+
+def get_async_session() -> AsyncSession:
+    """Async database session for code running on the event loop"""
+    return _async_sessionmaker()()
+
+
 def get_db():
     """Get database session"""
     db = SessionLocal()
@@ -9,7 +9,7 @@ from typing import Any
 
 from fastapi import BackgroundTasks, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 from .config import settings
@@ -50,6 +50,10 @@ async def lifespan(app: FastAPI):
     if crawler_service:
         await crawler_service.cleanup()
 
+    from .services.ai_service import AIService
+
+    await AIService.close_http_client()
+
 
 app = FastAPI(
     title="FENIX Eagle - Tender Monitoring Agent",
@@ -872,36 +876,45 @@ class EmailGenerationRequest(BaseModel):
     tender_id: str = Field(..., description="ID of the tender to generate email for")
 
 
+class BatchEmailGenerationRequest(BaseModel):
+    tender_ids: list[str] = Field(..., min_length=1, description="IDs of the tenders to generate emails for")
+
+
+def _load_tender_for_email(tender_id: str) -> dict[str, Any]:
+    """Load a stored tender and convert it to the dict expected by AIService"""
+    from .database.models import SessionLocal, StoredTender
+
+    db = SessionLocal()
+    try:
+        tender = db.query(StoredTender).filter(StoredTender.tender_id == tender_id).first()
+        if not tender:
+            raise HTTPException(status_code=404, detail="Tender not found")
+
+        return {
+            "tender_id": tender.tender_id,
+            "title": tender.title,
+            "description": tender.description or "",
+            "source": tender.source,
+            "source_url": tender.source_url,
+            "location": tender.location,
+            "estimated_value": tender.estimated_value,
+            "contact_info": tender.contact_info or {},
+            "keywords_found": tender.keywords_found or [],
+            "response_deadline": tender.response_deadline,
+        }
+
+    finally:
+        db.close()
+
+
 @app.post("/emails/generate")
 async def generate_business_email(request: EmailGenerationRequest):
     """Generate and store business email for a tender"""
     try:
-        from .database.models import SessionLocal, StoredTender
         from .services.ai_service import AIService
 
         # Get tender data from database
-        db = SessionLocal()
-        try:
-            tender = db.query(StoredTender).filter(StoredTender.tender_id == request.tender_id).first()
-            if not tender:
-                raise HTTPException(status_code=404, detail="Tender not found")
-
-            # Convert tender to dict for AI service
-            tender_data = {
-                "tender_id": tender.tender_id,
-                "title": tender.title,
-                "description": tender.description or "",
-                "source": tender.source,
-                "source_url": tender.source_url,
-                "location": tender.location,
-                "estimated_value": tender.estimated_value,
-                "contact_info": tender.contact_info or {},
-                "keywords_found": tender.keywords_found or [],
-                "response_deadline": tender.response_deadline,
-            }
-
-        finally:
-            db.close()
+        tender_data = _load_tender_for_email(request.tender_id)
 
         # Generate and store email
         ai_service = AIService()
@@ -916,6 +929,49 @@ async def generate_business_email(request: EmailGenerationRequest):
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@app.post("/emails/generate/stream")
+async def stream_business_email(request: EmailGenerationRequest):
+    """Stream business email content for a tender as it is generated, storing it once complete"""
+    try:
+        from .services.ai_service import AIService
+
+        tender_data = _load_tender_for_email(request.tender_id)
+
+        ai_service = AIService()
+        return StreamingResponse(
+            # ~20 tokens per flush instead of one HTTP chunk per token
+            ai_service.generate_business_email_stream(tender_data, min_chunk_chars=80),
+            media_type="text/plain; charset=utf-8",
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error streaming business email: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@app.post("/emails/generate/batch")
+async def generate_business_emails_batch(request: BatchEmailGenerationRequest, background_tasks: BackgroundTasks):
+    """Queue business emails for many tenders on the OpenAI Batch API (half price, done within 24h)"""
+    try:
+        from .services.ai_service import AIService
+
+        tender_list = [_load_tender_for_email(tender_id) for tender_id in request.tender_ids]
+
+        # The batch is submitted, polled and stored in the background; results appear under /emails
+        ai_service = AIService()
+        background_tasks.add_task(ai_service.generate_business_emails_batch, tender_list)
+
+        return {"message": "Batch email generation started", "tender_count": len(tender_list)}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error starting batch email generation: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
 @app.get("/emails")
 async def get_all_emails(limit: int = 100):
     """Get all generated emails"""
@@ -1099,7 +1155,10 @@ async def create_acc_project(project_name: str = "FENIX Test Project"):
         client = ACCClient()
 
         # Test authentication first
-        auth_result = await client.authenticate()
+        try:
+            auth_result = await client.authenticate()
+        finally:
+            await client.aclose()
         if not auth_result:
             return {"error": "Authentication failed", "auth_result": False}
 
@@ -1167,44 +1226,46 @@ async def debug_acc():
         from .services.acc_scraper import ACCClient
 
         client = ACCClient()
+        try:
+            # Test authentication
+            auth_result = await client.authenticate()
+            if not auth_result:
+                return {"error": "Authentication failed", "auth_result": False}
+
+            # Get projects
+            projects = await client.get_projects()
+
+            result = {
+                "auth_result": auth_result,
+                "access_token": client.access_token[:20] + "..." if client.access_token else None,
+                "projects_count": len(projects),
+                "projects": projects[:3],  # First 3 projects for debugging
+            }
 
-        # Test authentication
-        auth_result = await client.authenticate()
-        if not auth_result:
-            return {"error": "Authentication failed", "auth_result": False}
-
-        # Get projects
-        projects = await client.get_projects()
-
-        result = {
-            "auth_result": auth_result,
-            "access_token": client.access_token[:20] + "..." if client.access_token else None,
-            "projects_count": len(projects),
-            "projects": projects[:3],  # First 3 projects for debugging
-        }
-
-        # If we have projects, try to get data from first one
-        if projects:
-            first_project = projects[0]
-            project_id = first_project.get("id")
-
-            if project_id:
-                issues = await client.get_project_issues(project_id)
-                rfis = await client.get_project_rfis(project_id)
-                files = await client.search_project_files(project_id, ["window", "door"])
-
-                result["first_project_data"] = {
-                    "project_id": project_id,
-                    "project_name": first_project.get("attributes", {}).get("name", "Unknown"),
-                    "issues_count": len(issues),
-                    "rfis_count": len(rfis),
-                    "files_count": len(files),
-                    "sample_issues": issues[:1] if issues else [],
-                    "sample_rfis": rfis[:1] if rfis else [],
-                    "sample_files": files[:1] if files else [],
-                }
+            # If we have projects, try to get data from first one
+            if projects:
+                first_project = projects[0]
+                project_id = first_project.get("id")
+
+                if project_id:
+                    issues = await client.get_project_issues(project_id)
+                    rfis = await client.get_project_rfis(project_id)
+                    files = await client.search_project_files(project_id, ["window", "door"])
+
+                    result["first_project_data"] = {
+                        "project_id": project_id,
+                        "project_name": first_project.get("attributes", {}).get("name", "Unknown"),
+                        "issues_count": len(issues),
+                        "rfis_count": len(rfis),
+                        "files_count": len(files),
+                        "sample_issues": issues[:1] if issues else [],
+                        "sample_rfis": rfis[:1] if rfis else [],
+                        "sample_files": files[:1] if files else [],
+                    }
 
-        return result
+            return result
+        finally:
+            await client.aclose()
 
     except Exception as e:
         logger.error(f"ACC debug error: {e}")
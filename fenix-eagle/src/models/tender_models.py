@@ -35,12 +35,12 @@ class TenderData(BaseModel):
     response_deadline: datetime | None = None
     estimated_value: float | None = None
     location: str | None = None
-    naics_codes: list[str] = Field(default=[])
-    keywords_found: list[str] = Field(default=[])
+    naics_codes: list[str] = Field(default_factory=list)
+    keywords_found: list[str] = Field(default_factory=list)
     relevance_score: float | None = Field(default=None, ge=0, le=1)
-    contact_info: dict[str, Any] = Field(default={})
-    requirements: list[str] = Field(default=[])
-    extracted_data: dict[str, Any] = Field(default={})
+    contact_info: dict[str, Any] = Field(default_factory=dict)
+    requirements: list[str] = Field(default_factory=list)
+    extracted_data: dict[str, Any] = Field(default_factory=dict)
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime | None = None
 
@@ -48,8 +48,8 @@ class TenderData(BaseModel):
 class ScrapingJob(BaseModel):
     job_id: str
     source: TenderSource
-    keywords: list[str] = Field(default=[])
-    filters: dict[str, Any] = Field(default={})
+    keywords: list[str] = Field(default_factory=list)
+    filters: dict[str, Any] = Field(default_factory=dict)
     max_results: int = Field(default=100)
     status: ScrapingStatus = ScrapingStatus.PENDING
     created_at: datetime = Field(default_factory=datetime.now)
@@ -59,35 +59,35 @@ class ScrapingJob(BaseModel):
     progress: int = Field(default=0, ge=0, le=100)
     results_count: int = Field(default=0)
     error_message: str | None = None
-    metadata: dict[str, Any] = Field(default={})
+    metadata: dict[str, Any] = Field(default_factory=dict)
 
 
 class CrawlerConfig(BaseModel):
     source: TenderSource
     base_url: str
     search_endpoints: list[str]
-    headers: dict[str, str] = Field(default={})
-    rate_limits: dict[str, int] = Field(default={})
-    extraction_rules: dict[str, Any] = Field(default={})
-    ai_prompts: dict[str, str] = Field(default={})
+    headers: dict[str, str] = Field(default_factory=dict)
+    rate_limits: dict[str, int] = Field(default_factory=dict)
+    extraction_rules: dict[str, Any] = Field(default_factory=dict)
+    ai_prompts: dict[str, str] = Field(default_factory=dict)
 
 
 class ExtractedContent(BaseModel):
     url: str
     title: str | None = None
     content: str
-    metadata: dict[str, Any] = Field(default={})
+    metadata: dict[str, Any] = Field(default_factory=dict)
     extracted_at: datetime = Field(default_factory=datetime.now)
     extraction_method: str = "crawl4ai"
     ai_processed: bool = False
-    structured_data: dict[str, Any] = Field(default={})
+    structured_data: dict[str, Any] = Field(default_factory=dict)
 
 
 class RelevanceFilter(BaseModel):
     keywords: list[str]
-    required_terms: list[str] = Field(default=[])
-    excluded_terms: list[str] = Field(default=[])
+    required_terms: list[str] = Field(default_factory=list)
+    excluded_terms: list[str] = Field(default_factory=list)
     min_relevance_score: float = Field(default=0.5, ge=0, le=1)
-    location_filters: list[str] = Field(default=[])
+    location_filters: list[str] = Field(default_factory=list)
     value_range: dict[str, float] | None = None
     date_range: dict[str, datetime] | None = None
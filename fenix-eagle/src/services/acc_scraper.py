@@ -1,15 +1,84 @@
 import asyncio
+import time
 import uuid
 from datetime import datetime, timedelta
 from typing import Any
 
 import httpx
+import orjson
 from loguru import logger
 
 from ..config import settings
 from ..models.tender_models import TenderData, TenderSource
 
 
+# How long a fetched project list is reused before hitting the hubs/projects endpoints again
+_PROJECTS_CACHE_TTL = 60  # seconds
+
+_FENESTRATION_TERMS = ("window", "door", "glazing", "fenestration", "curtain wall", "storefront")
+
+# Per-kind conversion parameters. ``title_index`` points into the ``_project_item`` tuple;
+# a ``desc_key`` of None means the item has no description field (files/folders).
+_CONVERT_SPECS: dict[str, dict[str, Any]] = {
+    "issue": {
+        "title_index": 1,
+        "desc_key": "description",
+        "fallback": "Issue",
+        "title_prefix": "ACC Issue: ",
+        "url": "issues",
+        "score": 0.7,
+        "data_key": "issue_data",
+    },
+    "rfi": {
+        "title_index": 3,
+        "desc_key": "question",
+        "fallback": "RFI",
+        "title_prefix": "ACC RFI: ",
+        "url": "rfis",
+        "score": 0.8,
+        "data_key": "rfi_data",
+    },
+    "file": {
+        "title_index": 4,
+        "desc_key": None,
+        "fallback": "File",
+        "title_prefix": "ACC Document: ",
+        "url": "files",
+        "score": 0.6,
+        "data_key": "file_data",
+    },
+}
+
+
+def _project_item(item: dict[str, Any]) -> tuple[Any, str, str, str, str, str]:
+    """Project the hot fields of an ACC item into a flat tuple.
+
+    Returns ``(id, title, description, subject, display_name, search_text)`` where
+    ``search_text`` is the lowercased text used for keyword matching. Called once per
+    item so the relevance filter and the converters don't re-read the same dict keys.
+    """
+    attributes = item.get("attributes")
+    if not isinstance(attributes, dict):
+        attributes = {}
+
+    title = item.get("title") or ""
+    description = item.get("description") or ""
+    subject = item.get("subject") or ""
+    display_name = attributes.get("displayName") or ""
+    search_text = " ".join(
+        (
+            str(title),
+            str(item.get("displayName") or ""),
+            str(description),
+            str(subject),
+            str(display_name),
+            str(attributes.get("name") or ""),
+        )
+    ).lower()
+
+    return item.get("id"), title, description, subject, display_name, search_text
+
+
 class ACCClient:
     """Autodesk Construction Cloud API Client"""
 
@@ -23,10 +92,33 @@ class ACCClient:
         self.password = settings.autodesk_password
         self.access_token = None
         self.token_expires_at = None
+        self._http_client: httpx.AsyncClient | None = None
+        # (fetched at, (account_id, access_token), projects): a different identity never hits it
+        self._projects_cache: tuple[float, tuple[str | None, str | None], list[dict[str, Any]]] | None = None
+        self._projects_lock = asyncio.Lock()
+        # Issue, RFI and file requests run concurrently; only one of them may re-authenticate
+        self._auth_lock = asyncio.Lock()
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP/2 client, creating it on first use.
+
+        All calls go to developer.api.autodesk.com, so one multiplexed connection serves
+        concurrent issue/RFI/file requests instead of a TLS handshake per request.
+        """
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                http2=True,
+                base_url=self.base_url,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                timeout=30.0,
+            )
+        return self._http_client
 
-        # Debug credentials
-        logger.info(f"ACC Client initialized - client_id: {self.client_id[:10] if self.client_id else 'None'}...")
-        logger.info(f"ACC Client initialized - account_id: {self.account_id[:10] if self.account_id else 'None'}...")
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
 
     async def authenticate(self) -> bool:
         """Authenticate with Autodesk API using existing OAuth token or 2-legged fallback"""
@@ -43,28 +135,28 @@ class ACCClient:
                 return True
 
             # Fallback to 2-legged OAuth
-            async with httpx.AsyncClient() as client:
-                auth_data = {
-                    "grant_type": "client_credentials",
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "scope": "data:read account:read user-profile:read",
-                }
-
-                headers = {"Content-Type": "application/x-www-form-urlencoded"}
-
-                response = await client.post(self.auth_url, data=auth_data, headers=headers)
-
-                if response.status_code == 200:
-                    token_data = response.json()
-                    self.access_token = token_data.get("access_token")
-                    expires_in = token_data.get("expires_in", 3600)
-                    self.token_expires_at = datetime.now() + timedelta(seconds=expires_in)
-                    logger.info("Successfully authenticated with Autodesk API using 2-legged OAuth")
-                    return True
-                else:
-                    logger.error(f"Authentication failed: {response.status_code} - {response.text}")
-                    return False
+            client = self._get_http_client()
+            auth_data = {
+                "grant_type": "client_credentials",
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "scope": "data:read account:read user-profile:read",
+            }
+
+            headers = {"Content-Type": "application/x-www-form-urlencoded"}
+
+            response = await client.post(self.auth_url, data=auth_data, headers=headers)
+
+            if response.status_code == 200:
+                token_data = orjson.loads(response.content)
+                self.access_token = token_data.get("access_token")
+                expires_in = token_data.get("expires_in", 3600)
+                self.token_expires_at = datetime.now() + timedelta(seconds=expires_in)
+                logger.info("Successfully authenticated with Autodesk API using 2-legged OAuth")
+                return True
+            else:
+                logger.error(f"Authentication failed: {response.status_code} - {response.text}")
+                return False
 
         except Exception as e:
             logger.error(f"Error during authentication: {e}")
@@ -77,64 +169,87 @@ class ACCClient:
         return datetime.now() < self.token_expires_at - timedelta(minutes=5)  # 5 min buffer
 
     async def ensure_authenticated(self) -> bool:
-        """Ensure we have a valid access token"""
-        if not await self.is_token_valid():
-            return await self.authenticate()
-        return True
+        """Ensure we have a valid access token
+
+        The expiry check and re-authentication run under one lock, so concurrent callers
+        that find the token expired wait for a single authenticate() call.
+        """
+        async with self._auth_lock:
+            if not await self.is_token_valid():
+                return await self.authenticate()
+            return True
 
     async def get_projects(self) -> list[dict[str, Any]]:
-        """Get all ACC projects for the account"""
-        if not await self.ensure_authenticated():
-            raise Exception("Failed to authenticate")
+        """Get all ACC projects for the account, reusing the last result for _PROJECTS_CACHE_TTL seconds.
 
+        The result is cached per account and access token, so switching between 3-legged and
+        2-legged tokens or re-authenticating into another account fetches afresh. The lock
+        makes concurrent callers wait for a single refresh instead of each walking every hub.
+        """
+        async with self._projects_lock:
+            if not await self.ensure_authenticated():
+                raise Exception("Failed to authenticate")
+
+            identity = (self.account_id, self.access_token)
+            cached = self._projects_cache
+            if cached and cached[1] == identity and time.monotonic() - cached[0] < _PROJECTS_CACHE_TTL:
+                return cached[2]
+
+            projects = await self._fetch_projects()
+            if projects:
+                self._projects_cache = (time.monotonic(), identity, projects)
+            return projects
+
+    async def _fetch_projects(self) -> list[dict[str, Any]]:
+        """Fetch all ACC projects for the account from every hub (caller ensures authentication)"""
         try:
-            async with httpx.AsyncClient() as client:
-                headers = {
-                    "Authorization": f"Bearer {self.access_token}",
-                    "Content-Type": "application/json",
-                }
-
-                # Get projects from ACC using Project API
-                url = f"{self.base_url}/project/v1/hubs"
-
-                response = await client.get(url, headers=headers, timeout=30.0)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    hubs = data.get("data", [])
-                    logger.info(f"Retrieved {len(hubs)} hubs from Autodesk")
-                    logger.info(f"Hubs data sample: {hubs[:1] if hubs else 'No hubs'}")
-
-                    # For each hub, get projects
-                    all_projects = []
-                    for hub in hubs:
-                        hub_id = hub.get("id")
-                        hub_name = hub.get("attributes", {}).get("name", "Unknown Hub")
-                        logger.info(f"Processing hub: {hub_name} ({hub_id})")
-
-                        if hub_id:
-                            projects_url = f"{self.base_url}/project/v1/hubs/{hub_id}/projects"
-                            logger.info(f"Fetching projects from: {projects_url}")
-                            projects_response = await client.get(projects_url, headers=headers, timeout=30.0)
-
-                            if projects_response.status_code == 200:
-                                projects_data = projects_response.json()
-                                projects = projects_data.get("data", [])
-                                all_projects.extend(projects)
-                                logger.info(f"Retrieved {len(projects)} projects from hub {hub_id}")
-                                if projects:
-                                    logger.info(f"Sample project: {projects[0] if projects else 'None'}")
-                            else:
-                                logger.warning(
-                                    f"Failed to get projects from hub {hub_id}: "
-                                    f"{projects_response.status_code} - {projects_response.text}"
-                                )
-
-                    logger.info(f"Total projects collected: {len(all_projects)}")
-                    return all_projects
-                else:
-                    logger.error(f"Failed to get hubs: {response.status_code} - {response.text}")
-                    return []
+            client = self._get_http_client()
+            headers = {
+                "Authorization": f"Bearer {self.access_token}",
+                "Content-Type": "application/json",
+            }
+
+            # Get projects from ACC using Project API
+            url = f"{self.base_url}/project/v1/hubs"
+
+            response = await client.get(url, headers=headers, timeout=30.0)
+
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                hubs = data.get("data", [])
+                logger.info(f"Retrieved {len(hubs)} hubs from Autodesk")
+                logger.info(f"Hubs data sample: {hubs[:1] if hubs else 'No hubs'}")
+
+                # For each hub, get projects
+                all_projects = []
+                for hub in hubs:
+                    hub_id = hub.get("id")
+                    hub_name = hub.get("attributes", {}).get("name", "Unknown Hub")
+                    logger.info(f"Processing hub: {hub_name} ({hub_id})")
+
+                    if hub_id:
+                        projects_url = f"{self.base_url}/project/v1/hubs/{hub_id}/projects"
+                        logger.info(f"Fetching projects from: {projects_url}")
+                        projects_response = await client.get(projects_url, headers=headers, timeout=30.0)
+
+                        if projects_response.status_code == 200:
+                            projects_data = orjson.loads(projects_response.content)
+                            projects = projects_data.get("data", [])
+                            all_projects.extend(projects)
+                            logger.info(f"Retrieved {len(projects)} projects from hub {hub_id}")
+                            if projects:
+                                logger.info(f"Sample project: {projects[0] if projects else 'None'}")
+                        else:
+                            logger.warning(
+                                f"Failed to get projects from hub {hub_id}: "
+                                f"{projects_response.status_code} - {projects_response.text}"
+                            )
+
+                logger.info(f"Total projects collected: {len(all_projects)}")
+                return all_projects
+            else:
+                logger.error(f"Failed to get hubs: {response.status_code} - {response.text}")
+                return []
 
         except Exception as e:
             logger.error(f"Error getting projects: {e}")
@@ -146,24 +261,24 @@ class ACCClient:
             raise Exception("Failed to authenticate")
 
         try:
-            async with httpx.AsyncClient() as client:
-                headers = {
-                    "Authorization": f"Bearer {self.access_token}",
-                    "Content-Type": "application/json",
-                }
-
-                url = f"{self.base_url}/construction/issues/v1/containers/{project_id}/quality-issues"
-
-                response = await client.get(url, headers=headers, timeout=30.0)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    issues = data.get("results", [])
-                    logger.info(f"Retrieved {len(issues)} issues for project {project_id}")
-                    return issues
-                else:
-                    logger.warning(f"Failed to get issues for project {project_id}: {response.status_code}")
-                    return []
+            client = self._get_http_client()
+            headers = {
+                "Authorization": f"Bearer {self.access_token}",
+                "Content-Type": "application/json",
+            }
+
+            url = f"{self.base_url}/construction/issues/v1/containers/{project_id}/quality-issues"
+
+            response = await client.get(url, headers=headers, timeout=30.0)
+
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                issues = data.get("results", [])
+                logger.info(f"Retrieved {len(issues)} issues for project {project_id}")
+                return issues
+            else:
+                logger.warning(f"Failed to get issues for project {project_id}: {response.status_code}")
+                return []
 
         except Exception as e:
             logger.error(f"Error getting issues for project {project_id}: {e}")
@@ -175,24 +290,24 @@ class ACCClient:
             raise Exception("Failed to authenticate")
 
         try:
-            async with httpx.AsyncClient() as client:
-                headers = {
-                    "Authorization": f"Bearer {self.access_token}",
-                    "Content-Type": "application/json",
-                }
-
-                url = f"{self.base_url}/construction/rfis/v1/containers/{project_id}/rfis"
-
-                response = await client.get(url, headers=headers, timeout=30.0)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    rfis = data.get("results", [])
-                    logger.info(f"Retrieved {len(rfis)} RFIs for project {project_id}")
-                    return rfis
-                else:
-                    logger.warning(f"Failed to get RFIs for project {project_id}: {response.status_code}")
-                    return []
+            client = self._get_http_client()
+            headers = {
+                "Authorization": f"Bearer {self.access_token}",
+                "Content-Type": "application/json",
+            }
+
+            url = f"{self.base_url}/construction/rfis/v1/containers/{project_id}/rfis"
+
+            response = await client.get(url, headers=headers, timeout=30.0)
+
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                rfis = data.get("results", [])
+                logger.info(f"Retrieved {len(rfis)} RFIs for project {project_id}")
+                return rfis
+            else:
+                logger.warning(f"Failed to get RFIs for project {project_id}: {response.status_code}")
+                return []
 
         except Exception as e:
             logger.error(f"Error getting RFIs for project {project_id}: {e}")
@@ -204,35 +319,35 @@ class ACCClient:
             raise Exception("Failed to authenticate")
 
         try:
-            async with httpx.AsyncClient() as client:
-                headers = {
-                    "Authorization": f"Bearer {self.access_token}",
-                    "Content-Type": "application/json",
-                }
-
-                # Get project files
-                url = f"{self.base_url}/data/v1/projects/{project_id}/folders"
-
-                response = await client.get(url, headers=headers, timeout=30.0)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    folders = data.get("data", [])
-
-                    # Search through folders for relevant files
-                    relevant_files = []
-                    for folder in folders:
-                        folder_name = folder.get("attributes", {}).get("displayName", "").lower()
-
-                        # Check if folder name contains keywords
-                        if any(keyword.lower() in folder_name for keyword in keywords):
-                            relevant_files.append(folder)
-
-                    logger.info(f"Found {len(relevant_files)} relevant files for project {project_id}")
-                    return relevant_files
-                else:
-                    logger.warning(f"Failed to get files for project {project_id}: {response.status_code}")
-                    return []
+            client = self._get_http_client()
+            headers = {
+                "Authorization": f"Bearer {self.access_token}",
+                "Content-Type": "application/json",
+            }
+
+            # Get project files
+            url = f"{self.base_url}/data/v1/projects/{project_id}/folders"
+
+            response = await client.get(url, headers=headers, timeout=30.0)
+
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                folders = data.get("data", [])
+
+                # Search through folders for relevant files
+                relevant_files = []
+                for folder in folders:
+                    folder_name = folder.get("attributes", {}).get("displayName", "").lower()
+
+                    # Check if folder name contains keywords
+                    if any(keyword.lower() in folder_name for keyword in keywords):
+                        relevant_files.append(folder)
+
+                logger.info(f"Found {len(relevant_files)} relevant files for project {project_id}")
+                return relevant_files
+            else:
+                logger.warning(f"Failed to get files for project {project_id}: {response.status_code}")
+                return []
 
         except Exception as e:
             logger.error(f"Error searching files for project {project_id}: {e}")
@@ -245,29 +360,38 @@ class ACCScraper:
     def __init__(self):
         self.client = ACCClient()
         self.is_initialized = False
+        self._disabled = False
 
     async def initialize(self):
-        """Initialize the ACC scraper"""
+        """Initialize the ACC scraper, checking credentials and warming up the token once"""
         logger.info("Initializing ACC Scraper")
+        client = self.client
+        logger.info(f"ACC Client - client_id: {client.client_id[:10] if client.client_id else 'None'}...")
+        logger.info(f"ACC Client - account_id: {client.account_id[:10] if client.account_id else 'None'}...")
+
+        self._disabled = not (client.client_id and client.client_secret)
+        if self._disabled:
+            logger.error("ACC credentials not configured - ACC scraping disabled")
+        elif not await client.authenticate():
+            logger.warning("ACC warm-up authentication failed, will retry on first scrape")
+
         self.is_initialized = True
 
     async def cleanup(self):
         """Cleanup resources"""
         logger.info("Cleaning up ACC Scraper")
+        await self.client.aclose()
         self.is_initialized = False
 
     async def scrape_acc_data(self, keywords: list[str], max_results: int = 100) -> list[TenderData]:
         """
         Scrape ACC for construction project data relevant to fenestration
         """
-        logger.info(f"Starting ACC scraping with keywords: {keywords}")
-
-        if not self.client.client_id or not self.client.client_secret:
-            logger.error("ACC credentials not configured")
-            logger.error(f"client_id: {self.client.client_id[:10] if self.client.client_id else 'None'}...")
-            logger.error(f"client_secret: {self.client.client_secret[:10] if self.client.client_secret else 'None'}...")
+        if self._disabled:
             return []
 
+        logger.info(f"Starting ACC scraping with keywords: {keywords}")
+
         try:
             # Get all projects
             logger.info("Calling get_projects()...")
@@ -281,6 +405,7 @@ class ACCScraper:
                 return []
 
             all_results = []
+            keywords_lower = [keyword.lower() for keyword in keywords]
 
             for project in projects[:10]:  # Limit to first 10 projects for testing
                 project_id = project.get("id")
@@ -288,33 +413,34 @@ class ACCScraper:
 
                 logger.info(f"Processing project: {project_name} ({project_id})")
 
-                # Get project issues
-                issues = await self.client.get_project_issues(project_id)
-
-                # Get project RFIs
-                rfis = await self.client.get_project_rfis(project_id)
-
-                # Search project files
-                files = await self.client.search_project_files(project_id, keywords)
+                # Fetch issues, RFIs and matching files concurrently over the shared HTTP/2 connection
+                issues, rfis, files = await asyncio.gather(
+                    self.client.get_project_issues(project_id),
+                    self.client.get_project_rfis(project_id),
+                    self.client.search_project_files(project_id, keywords),
+                )
 
                 # Process issues into TenderData
                 for issue in issues:
-                    if self._is_relevant_to_keywords(issue, keywords):
-                        tender = self._convert_issue_to_tender(issue, project)
+                    projected = _project_item(issue)
+                    if self._is_relevant_to_keywords(projected, keywords_lower):
+                        tender = self._convert_issue_to_tender(issue, project, projected)
                         if tender:
                             all_results.append(tender)
 
                 # Process RFIs into TenderData
                 for rfi in rfis:
-                    if self._is_relevant_to_keywords(rfi, keywords):
-                        tender = self._convert_rfi_to_tender(rfi, project)
+                    projected = _project_item(rfi)
+                    if self._is_relevant_to_keywords(projected, keywords_lower):
+                        tender = self._convert_rfi_to_tender(rfi, project, projected)
                         if tender:
                             all_results.append(tender)
 
                 # Process files into TenderData (potential opportunities)
                 for file_item in files:
-                    if self._is_relevant_to_keywords(file_item, keywords):
-                        tender = self._convert_file_to_tender(file_item, project)
+                    projected = _project_item(file_item)
+                    if self._is_relevant_to_keywords(projected, keywords_lower):
+                        tender = self._convert_file_to_tender(file_item, project, projected)
                         if tender:
                             all_results.append(tender)
 
@@ -331,150 +457,71 @@ class ACCScraper:
             logger.error(f"Error in ACC scraping: {e}")
             return []
 
-    def _is_relevant_to_keywords(self, item: dict[str, Any], keywords: list[str]) -> bool:
-        """Check if an item is relevant to the search keywords"""
-        item_text = ""
-
-        # Extract text from various fields
-        if isinstance(item, dict):
-            item_text += str(item.get("title", "")) + " "
-            item_text += str(item.get("displayName", "")) + " "
-            item_text += str(item.get("description", "")) + " "
-            item_text += str(item.get("subject", "")) + " "
+    def _is_relevant_to_keywords(self, projected: tuple, keywords_lower: list[str]) -> bool:
+        """Check if a projected item (see ``_project_item``) matches any lowercased keyword"""
+        search_text = projected[5]
+        return any(keyword in search_text for keyword in keywords_lower)
+
+    def _convert(self, kind: str, item: dict[str, Any], project: dict[str, Any], projected: tuple) -> TenderData | None:
+        """Convert an ACC issue/RFI/file to TenderData using its entry in ``_CONVERT_SPECS``"""
+        spec = _CONVERT_SPECS[kind]
+        item_id = projected[0] or str(uuid.uuid4())
+        project_name = project.get("name")
+        project_id = project.get("id")
+        title = projected[spec["title_index"]] or f"{spec['fallback']} in {project.get('name', 'Unknown Project')}"
+
+        desc_key = spec["desc_key"]
+        if desc_key:
+            description = item.get(desc_key, "")
+            match_text = f"{title} {description}".lower()
+        else:
+            description = f"Construction document from project {project_name}"
+            match_text = title.lower()
+
+        # Extract keywords found
+        keywords_found = [term for term in _FENESTRATION_TERMS if term in match_text]
 
-            # Check attributes
-            attributes = item.get("attributes", {})
-            if isinstance(attributes, dict):
-                item_text += str(attributes.get("displayName", "")) + " "
-                item_text += str(attributes.get("name", "")) + " "
-
-        item_text = item_text.lower()
-
-        # Check if any keyword matches
-        return any(keyword.lower() in item_text for keyword in keywords)
-
-    def _convert_issue_to_tender(self, issue: dict[str, Any], project: dict[str, Any]) -> TenderData | None:
-        """Convert ACC issue to TenderData format"""
         try:
-            issue_id = issue.get("id", str(uuid.uuid4()))
-            title = issue.get("title") or f"Issue in {project.get('name', 'Unknown Project')}"
-            description = issue.get("description", "")
-
-            # Extract keywords found
-            keywords_found = []
-            issue_text = f"{title} {description}".lower()
-            fenestration_terms = ["window", "door", "glazing", "fenestration", "curtain wall", "storefront"]
-            for term in fenestration_terms:
-                if term in issue_text:
-                    keywords_found.append(term)
-
             return TenderData(
-                tender_id=issue_id,
-                title=f"ACC Issue: {title}",
+                tender_id=item_id,
+                title=f"{spec['title_prefix']}{title}",
                 description=description,
                 source=TenderSource.AUTODESK_ACC,
-                source_url=f"https://acc.autodesk.com/projects/{project.get('id')}/issues/{issue_id}",
+                source_url=f"https://acc.autodesk.com/projects/{project_id}/{spec['url']}/{item_id}",
                 posting_date=datetime.now(),
                 response_deadline=None,
                 estimated_value=None,
                 location=project.get("businessUnitId", ""),
                 keywords_found=keywords_found,
-                relevance_score=0.7,
+                relevance_score=spec["score"],
                 contact_info={
-                    "project_name": project.get("name"),
-                    "project_id": project.get("id"),
+                    "project_name": project_name,
+                    "project_id": project_id,
                 },
                 extracted_data={
-                    "type": "issue",
+                    "type": kind,
                     "project": project,
-                    "issue_data": issue,
+                    spec["data_key"]: item,
                 },
             )
-
-        except Exception as e:
-            logger.error(f"Error converting issue to tender: {e}")
+        except Exception:
+            logger.opt(exception=True).error("Error converting {} {} to tender", kind, item_id)
             return None
 
-    def _convert_rfi_to_tender(self, rfi: dict[str, Any], project: dict[str, Any]) -> TenderData | None:
-        """Convert ACC RFI to TenderData format"""
-        try:
-            rfi_id = rfi.get("id", str(uuid.uuid4()))
-            title = rfi.get("subject") or f"RFI in {project.get('name', 'Unknown Project')}"
-            description = rfi.get("question", "")
-
-            # Extract keywords found
-            keywords_found = []
-            rfi_text = f"{title} {description}".lower()
-            fenestration_terms = ["window", "door", "glazing", "fenestration", "curtain wall", "storefront"]
-            for term in fenestration_terms:
-                if term in rfi_text:
-                    keywords_found.append(term)
-
-            return TenderData(
-                tender_id=rfi_id,
-                title=f"ACC RFI: {title}",
-                description=description,
-                source=TenderSource.AUTODESK_ACC,
-                source_url=f"https://acc.autodesk.com/projects/{project.get('id')}/rfis/{rfi_id}",
-                posting_date=datetime.now(),
-                response_deadline=None,
-                estimated_value=None,
-                location=project.get("businessUnitId", ""),
-                keywords_found=keywords_found,
-                relevance_score=0.8,
-                contact_info={
-                    "project_name": project.get("name"),
-                    "project_id": project.get("id"),
-                },
-                extracted_data={
-                    "type": "rfi",
-                    "project": project,
-                    "rfi_data": rfi,
-                },
-            )
+    def _convert_issue_to_tender(
+        self, issue: dict[str, Any], project: dict[str, Any], projected: tuple
+    ) -> TenderData | None:
+        """Convert ACC issue to TenderData format"""
+        return self._convert("issue", issue, project, projected)
 
-        except Exception as e:
-            logger.error(f"Error converting RFI to tender: {e}")
-            return None
+    def _convert_rfi_to_tender(
+        self, rfi: dict[str, Any], project: dict[str, Any], projected: tuple
+    ) -> TenderData | None:
+        """Convert ACC RFI to TenderData format"""
+        return self._convert("rfi", rfi, project, projected)
 
-    def _convert_file_to_tender(self, file_item: dict[str, Any], project: dict[str, Any]) -> TenderData | None:
+    def _convert_file_to_tender(
+        self, file_item: dict[str, Any], project: dict[str, Any], projected: tuple
+    ) -> TenderData | None:
         """Convert ACC file/folder to TenderData format"""
-        try:
-            file_id = file_item.get("id", str(uuid.uuid4()))
-            attributes = file_item.get("attributes", {})
-            title = attributes.get("displayName") or f"File in {project.get('name', 'Unknown Project')}"
-
-            # Extract keywords found
-            keywords_found = []
-            file_text = title.lower()
-            fenestration_terms = ["window", "door", "glazing", "fenestration", "curtain wall", "storefront"]
-            for term in fenestration_terms:
-                if term in file_text:
-                    keywords_found.append(term)
-
-            return TenderData(
-                tender_id=file_id,
-                title=f"ACC Document: {title}",
-                description=f"Construction document from project {project.get('name')}",
-                source=TenderSource.AUTODESK_ACC,
-                source_url=f"https://acc.autodesk.com/projects/{project.get('id')}/files/{file_id}",
-                posting_date=datetime.now(),
-                response_deadline=None,
-                estimated_value=None,
-                location=project.get("businessUnitId", ""),
-                keywords_found=keywords_found,
-                relevance_score=0.6,
-                contact_info={
-                    "project_name": project.get("name"),
-                    "project_id": project.get("id"),
-                },
-                extracted_data={
-                    "type": "file",
-                    "project": project,
-                    "file_data": file_item,
-                },
-            )
-
-        except Exception as e:
-            logger.error(f"Error converting file to tender: {e}")
-            return None
+        return self._convert("file", file_item, project, projected)
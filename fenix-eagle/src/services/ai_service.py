@@ -1,113 +1,705 @@
+import asyncio
+import hashlib
+import json
 import logging
+import random
+import re
+import time
+import weakref
+import zlib
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Final, TypeVar
 from uuid import uuid4
 
-import openai
+import httpx
+from sqlalchemy import desc, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from ..config import settings
+from ..database.models import GeneratedEmail, get_async_session
+
+
+# openai (~0.5 s) and numpy are imported on first use so scraper-only processes never load them
+if TYPE_CHECKING:
+    import numpy as np
+    import openai
 
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Rough prompt + completion size of one email generation, used for token budgeting
+_ESTIMATED_REQUEST_TOKENS = 700
+_MAX_RATE_LIMIT_RETRIES = 6
+# Generated emails are reused for identical prompts (tenders re-emitted across scrapes)
+_EMAIL_CACHE_MAXSIZE = 1024
+_EMAIL_CACHE_TTL = 6 * 3600  # seconds
+# Near-duplicate reuse: prompts of the same tender (model, title, location, source, value,
+# deadline, contact) whose tender-specific text has hashed bag-of-words vectors with at least
+# this cosine similarity share one generated email
+_SIMILAR_PROMPT_THRESHOLD = 0.9
+_PROMPT_VECTOR_DIM = 4096
+_WORD_RE = re.compile(r"\w+")
+_BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+# Stored as ai_model_used when the email text came from the fallback template
+_FALLBACK_SOURCE: Final[str] = "fallback"
+
+# Static system prompt. Keep it byte-identical between calls and free of per-tender values
+# (those belong in the user message) so OpenAI's prompt cache can reuse the prefix.
+_SYSTEM_PROMPT: Final[str] = (
+    "You are a professional business representative of "
+    "Dual Action Windows (DAW), which has been delivering "
+    "high-quality European windows to USA since 2013. "
+    "IMPORTANT COMPANY INFORMATION: "
+    "- Founded in 2013 by Petr Pechousek (software engineer) "
+    "- We specialize in Tilt & Turn windows from Europe to USA "
+    "- Our principles: CARE (customer and planet care), "
+    "AFFORDABLE QUALITY (high quality at affordable prices), "
+    "HONESTY (we keep our word), SPEED (fast responses) "
+    "- We offer energy-efficient windows that outperform "
+    "domestic products "
+    "- We operate remotely from Czech Republic "
+    "Write a professional business email in English responding "
+    "to a found public tender/RFP. The email should be polite, "
+    "specific, mention our values and USA experience, ask for "
+    "missing information needed for proposal preparation. "
+    "PERSONALIZATION: If contact person name is provided, "
+    "address them directly by name (Dear Mr./Ms. [LastName]). "
+    "Reference the specific organization if provided. "
+    "Do NOT suggest in-person meetings or site visits since "
+    "we operate remotely from Czech Republic. "
+    "CRITICAL: You MUST end every email with this EXACT contact block: "
+    "Best regards, "
+    "Dual Action Windows Team "
+    ""
+    "Dual Action Windows, LLC "
+    ""
+    "US Mailing Address: "
+    "1601-1 N Main St #3159, Jacksonville, FL 32206, USA "
+    ""
+    "European Mailing Address: "
+    "Simackova 908/17, Prague 7, 170 00, Czech Republic "
+    ""
+    "📞 (321) 765-3355 "
+    "Call us now – our experts are here to help! "
+    ""
+    "✉️ info@dualactionwindows.com "
+    "Email us – our team is ready to assist you!"
+)
+_SYSTEM_MSG: Final[dict[str, str]] = {"role": "system", "content": _SYSTEM_PROMPT}
+
+# Request parameters shared by every email completion (realtime and batch); the model is picked per tender
+_BASE_KWARGS: Final[dict[str, Any]] = {"max_tokens": 600, "temperature": 0.7}
+
+# Static instructions appended to every email prompt, joined once at import time
+_PROMPT_TAIL: Final[str] = "\n".join(
+    [
+        "",
+        "Write a business email that:",
+        "1. Politely greets and introduces Dual Action Windows (DAW)",
+        "2. If contact name is provided, address the person by name",
+        "3. Specifically references this tender/RFP opportunity",
+        "4. Mentions our experience since 2013 delivering European windows",
+        "5. Emphasizes our principles: affordable quality, customer care",
+        "6. Highlights energy efficiency and Tilt & Turn technology",
+        "7. Requests additional technical information needed for proposal",
+        "8. Suggests next steps (remote consultation, spec review)",
+        "9. MUST end with complete contact information block:",
+        "",
+        "Contact Information to include at the end:",
+        "Dual Action Windows, LLC",
+        "",
+        "US Mailing Address:",
+        "1601-1 N Main St #3159, Jacksonville, FL 32206, USA",
+        "",
+        "European Mailing Address:",
+        "Simackova 908/17, Prague 7, 170 00, Czech Republic",
+        "",
+        "📞 (321) 765-3355",
+        "Call us now – our experts are here to help!",
+        "",
+        "✉️ info@dualactionwindows.com",
+        "Email us – our team is ready to assist you!",
+        "",
+        "Email should be max 250 words, professional but friendly tone. "
+        "IMPORTANT: Do NOT suggest in-person meetings or site visits. "
+        "CRITICAL REQUIREMENT: End with EXACT contact signature provided in system message - "
+        "do NOT use placeholders like [Your Name] or [Your Email]. Use the complete "
+        "Dual Action Windows contact block exactly as specified in system prompt.",
+    ]
+)
+
+# Fallback email used when AI generation is unavailable; filled with str.format
+_FALLBACK_TEMPLATE: Final[str] = """
+Dear Sir/Madam,
+
+We would like to respond to your tender opportunity "{title}"{location_part}.
+
+We are Dual Action Windows (DAW) - a company that has been successfully
+delivering high-quality European windows and doors to the US market since 2013.
+Our energy-efficient Tilt & Turn windows outperform domestic products in quality
+while maintaining competitive pricing.
+
+Our core principles include customer care, affordable quality, and fast
+responses through process automation.
+
+To prepare an accurate proposal, we would need the following information:
+
+• Technical specifications for required windows/doors
+• Dimensions and quantities of individual units
+• Material and energy efficiency class requirements
+• Project timeline and delivery requirements
+
+We would be happy to schedule a remote consultation to review detailed
+specifications and discuss your project requirements.
+
+Best regards,
+Dual Action Windows Team
+
+---
+
+Dual Action Windows, LLC
+
+US Mailing Address:
+1601-1 N Main St #3159, Jacksonville, FL 32206, USA
+
+European Mailing Address:
+Simackova 908/17, Prague 7, 170 00, Czech Republic
+
+📞 (321) 765-3355
+Call us now – our experts are here to help!
+
+✉️ info@dualactionwindows.com
+Email us – our team is ready to assist you!
+""".strip()
+
+# Contact block of the email prompt; lines whose field is missing render empty and are removed
+_CONTACT_TEMPLATE: Final[str] = (
+    "- Kontaktní informace:\n"
+    "  • Jméno: {name}\n"
+    "  • Email: {email}\n"
+    "  • Telefon: {phone}\n"
+    "  • Organizace: {organization}\n"
+)
+_EMPTY_CONTACT_LINE_RE = re.compile(r"^  • [^:\n]+: \n", re.M)
+
+# Pre-filter for automated emails: trades (when the source reports one) that DAW can bid on,
+# and lowercased location fragments configured as out of reach
+_EMAIL_TRADE_TERMS: Final[tuple[str, ...]] = ("window", "glazing", "glass", "facade", "façade", "door", "fenestration")
+_BLOCKED_LOCATIONS: Final[tuple[str, ...]] = tuple(
+    part.strip().lower() for part in settings.ai_email_location_blocklist.split(",") if part.strip()
+)
+
+# Technical specifications that are typically missing from tenders
+_STATIC_MISSING_SUGGESTIONS: Final[tuple[str, ...]] = (
+    "Technické specifikace oken/dveří",
+    "Rozměry a počty kusů",
+    "Požadavky na materiál",
+    "Energetická třída",
+    "Termín realizace",
+)
+
+
+def _select_model(tender_data: dict[str, Any]) -> str:
+    """Pick the email model: the cheaper default, or the premium one for high-value tenders"""
+    estimated_value = tender_data.get("estimated_value")
+    if estimated_value and estimated_value >= settings.openai_premium_value_threshold:
+        return settings.openai_premium_email_model
+    return settings.openai_email_model
+
+
+@lru_cache(maxsize=1024)
+def _fallback_email(title: str, location: str) -> str:
+    """Render the fallback email; only the title and location vary between tenders"""
+    location_part = f" v oblasti {location}" if location and location != "Nezadáno" else ""
+    return _FALLBACK_TEMPLATE.format(title=title, location_part=location_part)
+
+
+@lru_cache(maxsize=32)
+def _missing_info_suggestions(
+    has_value: bool, has_deadline: bool, has_email: bool, has_phone: bool, has_location: bool
+) -> tuple[str, ...]:
+    """Suggestions for one combination of present/missing tender fields (32 in total)"""
+    checks = (
+        (has_value, "Odhadovaná hodnota zakázky"),
+        (has_deadline, "Termín pro podání nabídky"),
+        (has_email, "Kontaktní email"),
+        (has_phone, "Kontaktní telefon"),
+        (has_location, "Přesná lokalita projektu"),
+    )
+    return (*(label for present, label in checks if not present), *_STATIC_MISSING_SUGGESTIONS)
+
+
+def _loop_local(store: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _T]", factory: Callable[[], _T]) -> _T:
+    """Return the value stored for the running event loop, creating it with ``factory`` on first use
+
+    asyncio primitives and connection pools are bound to the loop that first uses them, and
+    Celery tasks each run a fresh loop, so process-wide objects of that kind are kept per loop.
+    """
+    loop = asyncio.get_running_loop()
+    value = store.get(loop)
+    if value is None:
+        value = store[loop] = factory()
+    return value
+
+
+class _RateLimiter:
+    """Sliding one-minute window limiter for OpenAI requests and tokens"""
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._events: deque[tuple[float, int]] = deque()
+        self._tokens_in_window = 0
+        # The window is shared by every loop in the process; only the lock is per loop
+        self._locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = weakref.WeakKeyDictionary()
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until a request of ``tokens`` fits into the current window"""
+        async with _loop_local(self._locks, asyncio.Lock):
+            while True:
+                now = time.monotonic()
+                while self._events and now - self._events[0][0] >= 60:
+                    _, expired_tokens = self._events.popleft()
+                    self._tokens_in_window -= expired_tokens
+
+                if not self._events or (
+                    len(self._events) < self.requests_per_minute
+                    and self._tokens_in_window + tokens <= self.tokens_per_minute
+                ):
+                    self._events.append((now, tokens))
+                    self._tokens_in_window += tokens
+                    return
+
+                await asyncio.sleep(60 - (now - self._events[0][0]))
+
+
+class _TTLCache:
+    """Small LRU cache whose entries also expire after a fixed TTL"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self.ttl:
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: str, value: Any) -> str | None:
+        """Store ``value`` and return the key evicted to make room, if any"""
+        self._data[key] = (time.monotonic(), value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            return self._data.popitem(last=False)[0]
+        return None
+
+
+class _PromptCache(_TTLCache):
+    """Email cache with an exact prompt tier and a near-duplicate tier
+
+    Exact hits are looked up by request hash. On a miss, entries stored under the same
+    anchor (the model and tender fields that personalize the email) are compared by cosine
+    similarity of hashed bag-of-words vectors of the tender text, so a tender re-scraped with a
+    slightly different description or keyword list reuses the email already generated.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, threshold: float):
+        super().__init__(maxsize, ttl)
+        self.threshold = threshold
+        self._anchors: dict[str, str] = {}
+        self._vectors: dict[str, dict[str, np.ndarray]] = {}
+
+    @staticmethod
+    def _embed(text: str) -> "np.ndarray":
+        import numpy as np
+
+        buckets = [zlib.crc32(word.encode("utf-8")) % _PROMPT_VECTOR_DIM for word in _WORD_RE.findall(text.lower())]
+        vector = np.bincount(buckets, minlength=_PROMPT_VECTOR_DIM).astype(np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, key: str, anchor: str, text: str) -> Any:
+        """Return the cached email for ``key`` or for a near-duplicate prompt with the same anchor"""
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        bucket = self._vectors.get(anchor)
+        if not bucket:
+            return None
+
+        import numpy as np
+
+        keys = list(bucket)
+        scores = np.stack([bucket[k] for k in keys]) @ self._embed(text)
+        for index in np.argsort(scores)[::-1]:
+            if scores[index] < self.threshold:
+                break
+            cached = self.get(keys[index])
+            if cached is not None:
+                return cached
+            self._forget(keys[index])
+        return None
+
+    def put(self, key: str, anchor: str, text: str, value: Any) -> None:
+        evicted = self.set(key, value)
+        if evicted is not None:
+            self._forget(evicted)
+        self._anchors[key] = anchor
+        self._vectors.setdefault(anchor, {})[key] = self._embed(text)
+
+    def _forget(self, key: str) -> None:
+        anchor = self._anchors.pop(key, None)
+        bucket = self._vectors.get(anchor)
+        if bucket is not None:
+            bucket.pop(key, None)
+            if not bucket:
+                del self._vectors[anchor]
+
 
 class AIService:
     """Service for AI-powered content generation using OpenAI API"""
 
+    # Shared across instances - the service is created per request but the API limits are per account.
+    # The concurrency cap is one semaphore per event loop (see _loop_local).
+    _semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = weakref.WeakKeyDictionary()
+    _rate_limiter = _RateLimiter(settings.openai_requests_per_minute, settings.openai_tokens_per_minute)
+    # Maps prompts to (email, model that wrote it). Lookups and updates never await, so the
+    # event loop needs no extra lock around them
+    _email_cache = _PromptCache(_EMAIL_CACHE_MAXSIZE, _EMAIL_CACHE_TTL, _SIMILAR_PROMPT_THRESHOLD)
+    # One HTTP/2 connection pool to api.openai.com (and the OpenAI client on top of it) per
+    # event loop, shared by all instances and closed by close_http_client in the same loop
+    _http_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = weakref.WeakKeyDictionary()
+    _openai_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, "openai.AsyncOpenAI"] = (
+        weakref.WeakKeyDictionary()
+    )
+
     def __init__(self):
-        self.client = None
-        if settings.openai_api_key:
-            self.client = openai.OpenAI(api_key=settings.openai_api_key)
-        else:
+        if not settings.openai_api_key:
             logger.warning("OpenAI API key not configured")
 
-    async def generate_business_email(self, tender_data: dict[str, Any]) -> str:
+    @property
+    def client(self) -> "openai.AsyncOpenAI | None":
+        """OpenAI client of the running event loop, built on first use so listing/suggestion-only
+        callers never create one"""
+        if not settings.openai_api_key:
+            return None
+
+        loop = asyncio.get_running_loop()
+        client = self._openai_clients.get(loop)
+        if client is None or self._http_clients[loop].is_closed:
+            import openai
+
+            client = self._openai_clients[loop] = openai.AsyncOpenAI(
+                api_key=settings.openai_api_key, http_client=self._shared_http_client()
+            )
+        return client
+
+    @classmethod
+    def _shared_http_client(cls) -> httpx.AsyncClient:
+        """Return the running loop's HTTP/2 transport for OpenAI requests, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        http_client = cls._http_clients.get(loop)
+        if http_client is None or http_client.is_closed:
+            http_client = cls._http_clients[loop] = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=128, max_keepalive_connections=64),
+                timeout=httpx.Timeout(60.0, connect=5.0),
+            )
+        return http_client
+
+    @classmethod
+    async def close_http_client(cls):
+        """Close the running loop's OpenAI transport (call on application shutdown and at the
+        end of each scheduler task, before its event loop is discarded)"""
+        loop = asyncio.get_running_loop()
+        cls._openai_clients.pop(loop, None)
+        http_client = cls._http_clients.pop(loop, None)
+        if http_client is not None:
+            await http_client.aclose()
+
+    def should_generate(self, tender_data: dict[str, Any]) -> bool:
+        """
+        Cheap pre-filter deciding whether a tender is worth an AI completion
+
+        A tender qualifies when it matched at least one search keyword, its location is not
+        on the configured blocklist and, if the source reports a trade, the trade is one of
+        the fenestration trades.
+
+        Args:
+            tender_data: Dictionary containing tender information
+
+        Returns:
+            True if an AI email should be generated
+        """
+        if not tender_data.get("keywords_found"):
+            return False
+
+        location = (tender_data.get("location") or "").lower()
+        if any(blocked in location for blocked in _BLOCKED_LOCATIONS):
+            return False
+
+        trade = ((tender_data.get("extracted_data") or {}).get("trade") or "").lower()
+        return not trade or any(term in trade for term in _EMAIL_TRADE_TERMS)
+
+    async def generate_business_email(self, tender_data: dict[str, Any], screen: bool = False) -> str:
         """
         Generate business email content responding to a tender opportunity
 
         Args:
             tender_data: Dictionary containing tender information
+            screen: Return the template email without calling OpenAI when should_generate
+                rejects the tender (used for automated notifications)
 
         Returns:
             Generated email content as string
         """
+        return (await self._generate_email(tender_data, screen))[0]
+
+    async def _generate_email(self, tender_data: dict[str, Any], screen: bool = False) -> tuple[str, str]:
+        """Generate the email and report the model that wrote it, or "fallback" for the template
+
+        Emails reused from the prompt cache report the model of the original completion.
+        """
+        if screen and not self.should_generate(tender_data):
+            return self._get_fallback_email(tender_data), _FALLBACK_SOURCE
+
         if not self.client:
             logger.error("OpenAI client not initialized")
-            return self._get_fallback_email(tender_data)
+            return self._get_fallback_email(tender_data), _FALLBACK_SOURCE
 
         try:
-            # Prepare context from tender data
-            context = self._prepare_tender_context(tender_data)
+            params = self._completion_params(tender_data)
+            cache_key = self._cache_key(params)
+            anchor = self._similarity_anchor(tender_data, params["model"])
+            prompt = self._similarity_text(params)
+            cached = self._email_cache.lookup(cache_key, anchor, prompt)
+            if cached is not None:
+                logger.info("Reusing cached email for tender %s", tender_data.get("tender_id"))
+                return cached
+
+            response = await self._create_completion(**params)
+
+            usage = getattr(response, "usage", None)
+            details = getattr(usage, "prompt_tokens_details", None)
+            if details is not None:
+                logger.debug("OpenAI prompt tokens cached: %s/%s", details.cached_tokens, usage.prompt_tokens)
+
+            generated_content = response.choices[0].message.content.strip()
+            self._email_cache.put(cache_key, anchor, prompt, (generated_content, params["model"]))
+            return generated_content, params["model"]
 
-            # Generate AI response
-            prompt = self._build_email_prompt(context)
+        except Exception as e:
+            logger.exception("Failed to generate AI email content: %s", e)
+            return self._get_fallback_email(tender_data), _FALLBACK_SOURCE
 
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "You are a professional business representative of "
-                            "Dual Action Windows (DAW), which has been delivering "
-                            "high-quality European windows to USA since 2013. "
-                            "IMPORTANT COMPANY INFORMATION: "
-                            "- Founded in 2013 by Petr Pechousek (software engineer) "
-                            "- We specialize in Tilt & Turn windows from Europe to USA "
-                            "- Our principles: CARE (customer and planet care), "
-                            "AFFORDABLE QUALITY (high quality at affordable prices), "
-                            "HONESTY (we keep our word), SPEED (fast responses) "
-                            "- We offer energy-efficient windows that outperform "
-                            "domestic products "
-                            "- We operate remotely from Czech Republic "
-                            "Write a professional business email in English responding "
-                            "to a found public tender/RFP. The email should be polite, "
-                            "specific, mention our values and USA experience, ask for "
-                            "missing information needed for proposal preparation. "
-                            "PERSONALIZATION: If contact person name is provided, "
-                            "address them directly by name (Dear Mr./Ms. [LastName]). "
-                            "Reference the specific organization if provided. "
-                            "Do NOT suggest in-person meetings or site visits since "
-                            "we operate remotely from Czech Republic. "
-                            "CRITICAL: You MUST end every email with this EXACT contact block: "
-                            "Best regards, "
-                            "Dual Action Windows Team "
-                            ""
-                            "Dual Action Windows, LLC "
-                            ""
-                            "US Mailing Address: "
-                            "1601-1 N Main St #3159, Jacksonville, FL 32206, USA "
-                            ""
-                            "European Mailing Address: "
-                            "Simackova 908/17, Prague 7, 170 00, Czech Republic "
-                            ""
-                            "📞 (321) 765-3355 "
-                            "Call us now – our experts are here to help! "
-                            ""
-                            "✉️ info@dualactionwindows.com "
-                            "Email us – our team is ready to assist you!"
-                        ),
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=600,
-                temperature=0.7,
-            )
+    async def generate_business_email_stream(
+        self, tender_data: dict[str, Any], min_chunk_chars: int = 0
+    ) -> AsyncIterator[str]:
+        """
+        Stream business email content for a tender as it is generated
+
+        Yields text chunks as soon as OpenAI produces them so HTTP responses can start
+        flushing before the completion finishes. Once the email is complete it is cached
+        like in generate_business_email and stored like in create_and_store_business_email.
+        If generation fails before anything was sent, the fallback email is yielded (and
+        stored) instead; an email cut off mid-stream is not stored.
 
-            generated_content = response.choices[0].message.content
-            return generated_content.strip()
+        Args:
+            tender_data: Dictionary containing tender information
+            min_chunk_chars: Coalesce deltas after the first one until at least this many
+                characters are buffered, so HTTP responses are not flushed token by token
+
+        Yields:
+            Chunks of generated email content
+        """
+        if not self.client:
+            logger.error("OpenAI client not initialized")
+            fallback = self._get_fallback_email(tender_data)
+            yield fallback
+            await self._store_business_email(tender_data, fallback, _FALLBACK_SOURCE)
+            return
+
+        params = self._completion_params(tender_data)
+        cache_key = self._cache_key(params)
+        anchor = self._similarity_anchor(tender_data, params["model"])
+        prompt = self._similarity_text(params)
+        cached = self._email_cache.lookup(cache_key, anchor, prompt)
+        if cached is not None:
+            yield cached[0]
+            await self._store_business_email(tender_data, *cached)
+            return
+
+        chunks: list[str] = []
+        pending: list[str] = []
+        pending_chars = 0
+        try:
+            # The concurrency slot stays held until the whole stream has been read
+            async with self._completion(**params, stream=True) as stream:
+                try:
+                    async for chunk in stream:
+                        if not chunk.choices:
+                            continue
+                        delta = chunk.choices[0].delta.content
+                        if delta:
+                            chunks.append(delta)
+                            pending.append(delta)
+                            pending_chars += len(delta)
+                            # The first delta always goes out at once to keep time to first byte low
+                            if len(chunks) == 1 or pending_chars >= min_chunk_chars:
+                                yield "".join(pending)
+                                pending.clear()
+                                pending_chars = 0
+                finally:
+                    # Also runs when the client disconnects (GeneratorExit), so the upstream
+                    # HTTP/2 stream is never left open
+                    await stream.close()
 
         except Exception as e:
-            logger.error(f"Failed to generate AI email content: {str(e)}")
-            return self._get_fallback_email(tender_data)
+            logger.exception("Failed to stream AI email content: %s", e)
+            if not chunks:
+                fallback = self._get_fallback_email(tender_data)
+                yield fallback
+                await self._store_business_email(tender_data, fallback, _FALLBACK_SOURCE)
+            elif pending:
+                yield "".join(pending)
+            return
+
+        if pending:
+            yield "".join(pending)
+        email_content = "".join(chunks).strip()
+        self._email_cache.put(cache_key, anchor, prompt, (email_content, params["model"]))
+        await self._store_business_email(tender_data, email_content, params["model"])
+
+    async def generate_many(self, tender_list: list[dict[str, Any]], screen: bool = False) -> list[str]:
+        """
+        Generate business emails for many tenders concurrently
+
+        Requests run in parallel up to the shared concurrency and rate limits.
+
+        Args:
+            tender_list: List of tender dictionaries
+            screen: Passed to generate_business_email for every tender
+
+        Returns:
+            Generated email contents in tender_list order
+        """
+        return list(
+            await asyncio.gather(*(self.generate_business_email(tender, screen=screen) for tender in tender_list))
+        )
+
+    def _completion_params(self, tender_data: dict[str, Any]) -> dict[str, Any]:
+        """Build the chat.completions request body for a tender email"""
+        # Prepare context from tender data
+        context = self._prepare_tender_context(tender_data)
+
+        prompt = self._build_email_prompt(context)
+
+        # Static system prompt first, per-tender prompt last; ``user`` keeps requests from one
+        # source on the same OpenAI cache routing so the shared prefix is served from cache
+        return {
+            **_BASE_KWARGS,
+            "model": _select_model(context),
+            "messages": [_SYSTEM_MSG, {"role": "user", "content": prompt}],
+            "user": f"fenix-{context['source']}",
+        }
+
+    @staticmethod
+    def _cache_key(params: dict[str, Any]) -> str:
+        """Hash a completion request body; identical prompts and parameters give identical keys"""
+        canonical = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+    @classmethod
+    def _similarity_anchor(cls, tender_data: dict[str, Any], model: str) -> str:
+        """Key of the request and tender fields an email depends on; near-duplicates must match it exactly"""
+        return cls._cache_key(
+            {
+                "model": model,
+                "title": tender_data.get("title"),
+                "location": tender_data.get("location"),
+                "source": tender_data.get("source"),
+                "estimated_value": tender_data.get("estimated_value"),
+                "response_deadline": tender_data.get("response_deadline"),
+                "contact_info": tender_data.get("contact_info") or {},
+            }
+        )
+
+    @staticmethod
+    def _similarity_text(params: dict[str, Any]) -> str:
+        """Tender-specific part of the email prompt compared by the near-duplicate tier
+
+        The static instructions are left out; being the same in every prompt, they would
+        outweigh the description and keywords that tell two tenders apart.
+        """
+        return params["messages"][-1]["content"].removesuffix(_PROMPT_TAIL)
+
+    @classmethod
+    def _loop_semaphore(cls) -> asyncio.Semaphore:
+        """Concurrency cap for OpenAI requests made from the running event loop"""
+        return _loop_local(cls._semaphores, lambda: asyncio.Semaphore(settings.openai_max_concurrency))
+
+    async def _create_completion(self, *, estimated_tokens: int = _ESTIMATED_REQUEST_TOKENS, **kwargs: Any):
+        """Call chat.completions.create within the concurrency/rate limits, backing off on 429s"""
+        async with self._completion(estimated_tokens=estimated_tokens, **kwargs) as response:
+            return response
+
+    @asynccontextmanager
+    async def _completion(self, *, estimated_tokens: int = _ESTIMATED_REQUEST_TOKENS, **kwargs: Any):
+        """
+        Create a completion within the concurrency/rate limits, backing off on 429s
+
+        The concurrency slot is held until the block exits, so a streamed response is read
+        under the same cap as the request that opened it.
+        """
+        import openai
+
+        semaphore = self._loop_semaphore()
+        for attempt in range(_MAX_RATE_LIMIT_RETRIES):
+            await semaphore.acquire()
+            try:
+                await self._rate_limiter.acquire(estimated_tokens)
+                response = await self.client.chat.completions.create(**kwargs)
+            except openai.RateLimitError:
+                semaphore.release()
+                if attempt == _MAX_RATE_LIMIT_RETRIES - 1:
+                    raise
+                delay = min(30.0, 2**attempt) + random.uniform(0, 1)
+                logger.warning("OpenAI rate limit hit, retrying in %.1fs", delay)
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                semaphore.release()
+                raise
+
+            try:
+                yield response
+            finally:
+                semaphore.release()
+            return
 
     def _prepare_tender_context(self, tender_data: dict[str, Any]) -> dict[str, Any]:
         """Extract and organize relevant information from tender data"""
+        description = tender_data.get("description") or ""
+        if len(description) > 200:
+            description = f"{description[:200]}..."
         return {
             "title": tender_data.get("title", "Nezadáno"),
             "location": tender_data.get("location", "Nezadáno"),
             "estimated_value": tender_data.get("estimated_value"),
-            "description": tender_data.get("description", ""),
+            "description": description,
             "contact_info": tender_data.get("contact_info", {}),
             "response_deadline": tender_data.get("response_deadline"),
             "source": tender_data.get("source", "Nezadáno"),
@@ -116,6 +708,13 @@ class AIService:
 
     def _build_email_prompt(self, context: dict[str, Any]) -> str:
         """Build prompt for AI email generation"""
+        prompt_parts = self._tender_prompt_lines(context)
+        # Join once with the static tail rather than concatenating two large strings afterwards
+        prompt_parts.append(_PROMPT_TAIL)
+        return "\n".join(prompt_parts)
+
+    def _tender_prompt_lines(self, context: dict[str, Any]) -> list[str]:
+        """Describe one tender for the email prompt, without the static instructions"""
         prompt_parts = [
             "Nalezl jsem tuto veřejnou zakázku:",
             f"- Název: {context['title']}",
@@ -127,10 +726,7 @@ class AIService:
             prompt_parts.append(f"- Odhadovaná hodnota: ${context['estimated_value']:,.0f}")
 
         if context["description"]:
-            description = (
-                context["description"][:200] + "..." if len(context["description"]) > 200 else context["description"]
-            )
-            prompt_parts.append(f"- Popis: {description}")
+            prompt_parts.append(f"- Popis: {context['description']}")
 
         if context["keywords_found"]:
             prompt_parts.append(f"- Klíčová slova: {', '.join(context['keywords_found'])}")
@@ -141,137 +737,30 @@ class AIService:
         # Add contact information if available
         contact_info = context.get("contact_info", {})
         if contact_info:
-            prompt_parts.append("- Kontaktní informace:")
-            if contact_info.get("name"):
-                prompt_parts.append(f"  • Jméno: {contact_info['name']}")
-            if contact_info.get("email"):
-                prompt_parts.append(f"  • Email: {contact_info['email']}")
-            if contact_info.get("phone"):
-                prompt_parts.append(f"  • Telefon: {contact_info['phone']}")
-            if contact_info.get("organization"):
-                prompt_parts.append(f"  • Organizace: {contact_info['organization']}")
-
-        prompt_parts.extend(
-            [
-                "",
-                "Write a business email that:",
-                "1. Politely greets and introduces Dual Action Windows (DAW)",
-                "2. If contact name is provided, address the person by name",
-                "3. Specifically references this tender/RFP opportunity",
-                "4. Mentions our experience since 2013 delivering European windows",
-                "5. Emphasizes our principles: affordable quality, customer care",
-                "6. Highlights energy efficiency and Tilt & Turn technology",
-                "7. Requests additional technical information needed for proposal",
-                "8. Suggests next steps (remote consultation, spec review)",
-                "9. MUST end with complete contact information block:",
-                "",
-                "Contact Information to include at the end:",
-                "Dual Action Windows, LLC",
-                "",
-                "US Mailing Address:",
-                "1601-1 N Main St #3159, Jacksonville, FL 32206, USA",
-                "",
-                "European Mailing Address:",
-                "Simackova 908/17, Prague 7, 170 00, Czech Republic",
-                "",
-                "📞 (321) 765-3355",
-                "Call us now – our experts are here to help!",
-                "",
-                "✉️ info@dualactionwindows.com",
-                "Email us – our team is ready to assist you!",
-                "",
-                "Email should be max 250 words, professional but friendly tone. "
-                "IMPORTANT: Do NOT suggest in-person meetings or site visits. "
-                "CRITICAL REQUIREMENT: End with EXACT contact signature provided in system message - "
-                "do NOT use placeholders like [Your Name] or [Your Email]. Use the complete "
-                "Dual Action Windows contact block exactly as specified in system prompt.",
-            ]
-        )
+            fields = defaultdict(str, {key: value for key, value in contact_info.items() if value})
+            contact_block = _EMPTY_CONTACT_LINE_RE.sub("", _CONTACT_TEMPLATE.format_map(fields))
+            prompt_parts.append(contact_block.rstrip("\n"))
 
-        return "\n".join(prompt_parts)
+        return prompt_parts
 
     def _get_fallback_email(self, tender_data: dict[str, Any]) -> str:
         """Fallback email content when AI generation fails"""
-        title = tender_data.get("title", "nabídky")
-        location = tender_data.get("location", "")
-
-        location_part = f" v oblasti {location}" if location and location != "Nezadáno" else ""
-
-        return f"""
-Dear Sir/Madam,
-
-We would like to respond to your tender opportunity "{title}"{location_part}.
-
-We are Dual Action Windows (DAW) - a company that has been successfully
-delivering high-quality European windows and doors to the US market since 2013.
-Our energy-efficient Tilt & Turn windows outperform domestic products in quality
-while maintaining competitive pricing.
-
-Our core principles include customer care, affordable quality, and fast
-responses through process automation.
-
-To prepare an accurate proposal, we would need the following information:
-
-• Technical specifications for required windows/doors
-• Dimensions and quantities of individual units
-• Material and energy efficiency class requirements
-• Project timeline and delivery requirements
-
-We would be happy to schedule a remote consultation to review detailed
-specifications and discuss your project requirements.
-
-Best regards,
-Dual Action Windows Team
-
----
-
-Dual Action Windows, LLC
-
-US Mailing Address:
-1601-1 N Main St #3159, Jacksonville, FL 32206, USA
-
-European Mailing Address:
-Simackova 908/17, Prague 7, 170 00, Czech Republic
-
-📞 (321) 765-3355
-Call us now – our experts are here to help!
-
-✉️ info@dualactionwindows.com
-Email us – our team is ready to assist you!
-""".strip()
+        return _fallback_email(tender_data.get("title", "nabídky"), tender_data.get("location", ""))
 
     def get_missing_info_suggestions(self, tender_data: dict[str, Any]) -> list[str]:
         """Analyze tender data and suggest what information might be missing"""
-        suggestions = []
-
-        if not tender_data.get("estimated_value"):
-            suggestions.append("Odhadovaná hodnota zakázky")
-
-        if not tender_data.get("response_deadline"):
-            suggestions.append("Termín pro podání nabídky")
-
-        if not tender_data.get("contact_info", {}).get("email"):
-            suggestions.append("Kontaktní email")
-
-        if not tender_data.get("contact_info", {}).get("phone"):
-            suggestions.append("Kontaktní telefon")
-
-        if not tender_data.get("location") or tender_data.get("location") == "Nezadáno":
-            suggestions.append("Přesná lokalita projektu")
-
-        # Technical specifications that are typically missing
-        suggestions.extend(
-            [
-                "Technické specifikace oken/dveří",
-                "Rozměry a počty kusů",
-                "Požadavky na materiál",
-                "Energetická třída",
-                "Termín realizace",
-            ]
+        contact_info = tender_data.get("contact_info") or {}
+        location = tender_data.get("location")
+        return list(
+            _missing_info_suggestions(
+                bool(tender_data.get("estimated_value")),
+                bool(tender_data.get("response_deadline")),
+                bool(contact_info.get("email")),
+                bool(contact_info.get("phone")),
+                bool(location) and location != "Nezadáno",
+            )
         )
 
-        return suggestions
-
     async def create_and_store_business_email(self, tender_data: dict[str, Any]) -> dict[str, Any]:
         """
         Generate business email and store it in database
@@ -283,37 +772,34 @@ Email us – our team is ready to assist you!
             Dictionary with email info and database ID
         """
         # Generate email content
-        email_content = await self.generate_business_email(tender_data)
+        email_content, ai_model = await self._generate_email(tender_data)
+        return await self._store_business_email(tender_data, email_content, ai_model)
 
+    async def _store_business_email(
+        self, tender_data: dict[str, Any], email_content: str, ai_model: str
+    ) -> dict[str, Any]:
+        """Store a generated email; the email data is returned even if storage fails"""
         # Extract subject from email content
         subject = self._extract_email_subject(email_content, tender_data)
 
         # Store in database
         try:
-            from ..database.models import GeneratedEmail, SessionLocal
-
-            db = SessionLocal()
-            try:
+            async with get_async_session() as db:
                 generated_email = GeneratedEmail(
-                    tender_id=tender_data.get("tender_id") or str(uuid4()),
-                    email_subject=subject,
-                    email_content=email_content,
-                    ai_model_used="gpt-4",
-                    prompt_version="v1.0",
-                    contact_info=tender_data.get("contact_info", {}),
-                    tender_info={
-                        "title": tender_data.get("title", ""),
-                        "source": tender_data.get("source", ""),
-                        "location": tender_data.get("location", ""),
-                        "estimated_value": tender_data.get("estimated_value"),
-                    },
-                    status="generated",
-                    email_metadata={},
+                    **self._generated_email_values(
+                        tender_data,
+                        {
+                            "tender_id": tender_data.get("tender_id") or str(uuid4()),
+                            "subject": subject,
+                            "content": email_content,
+                            "ai_model": ai_model,
+                        },
+                    )
                 )
 
                 db.add(generated_email)
-                db.commit()
-                db.refresh(generated_email)
+                await db.commit()
+                await db.refresh(generated_email)
 
                 return {
                     "email_id": str(generated_email.id),
@@ -322,14 +808,12 @@ Email us – our team is ready to assist you!
                     "content": email_content,
                     "generated_at": generated_email.generated_at.isoformat(),
                     "status": "generated",
-                    "ai_model": "gpt-4",
+                    "ai_model": generated_email.ai_model_used,
                 }
 
-            finally:
-                db.close()
-
         except Exception as e:
-            logger.error(f"Failed to store generated email: {str(e)}")
+            error = str(e)
+            logger.exception("Failed to store generated email: %s", error)
             # Return email data even if storage failed
             return {
                 "email_id": None,
@@ -338,17 +822,175 @@ Email us – our team is ready to assist you!
                 "content": email_content,
                 "generated_at": datetime.now().isoformat(),
                 "status": "generation_only",
-                "error": f"Storage failed: {str(e)}",
+                "error": f"Storage failed: {error}",
             }
 
+    async def generate_business_emails_batch(
+        self, tender_list: list[dict[str, Any]], poll_interval: float = 30.0
+    ) -> list[dict[str, Any]]:
+        """
+        Generate business emails for many tenders through the OpenAI Batch API and store them
+
+        Batch jobs finish within 24 hours at half the token price, which suits emails produced
+        from a scraper sweep and reviewed later. Use create_and_store_business_email for
+        single/manual generations. Tenders missing from the batch output get the fallback email
+        and are stored with status "fallback". All rows are stored in a single transaction.
+
+        Args:
+            tender_list: List of tender dictionaries
+            poll_interval: Initial delay between batch status checks, doubled up to 10 minutes
+
+        Returns:
+            List of email info dictionaries in tender_list order
+        """
+        tender_ids = [tender.get("tender_id") or str(uuid4()) for tender in tender_list]
+        # The index keeps custom_ids unique when the same tender appears more than once
+        custom_ids = [f"{tender_id}-{index}" for index, tender_id in enumerate(tender_ids)]
+        contents: dict[str, str] = {}
+
+        if self.client and tender_list:
+            try:
+                lines = [
+                    json.dumps(
+                        {
+                            "custom_id": custom_id,
+                            "method": "POST",
+                            "url": "/v1/chat/completions",
+                            "body": self._completion_params(tender),
+                        },
+                        ensure_ascii=False,
+                    )
+                    for custom_id, tender in zip(custom_ids, tender_list, strict=True)
+                ]
+                input_file = await self.client.files.create(
+                    file=("tender_emails.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch"
+                )
+                batch = await self.client.batches.create(
+                    input_file_id=input_file.id, endpoint="/v1/chat/completions", completion_window="24h"
+                )
+                logger.info("Submitted OpenAI batch %s with %d tender emails", batch.id, len(lines))
+
+                delay = poll_interval
+                while batch.status not in _BATCH_TERMINAL_STATUSES:
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, 600.0)
+                    batch = await self.client.batches.retrieve(batch.id)
+
+                if batch.status == "completed" and batch.output_file_id:
+                    output = await self.client.files.content(batch.output_file_id)
+                    for line in output.text.splitlines():
+                        record = json.loads(line)
+                        response = record.get("response") or {}
+                        if response.get("status_code") == 200:
+                            message = response["body"]["choices"][0]["message"]["content"]
+                            contents[record["custom_id"]] = message.strip()
+                else:
+                    logger.error("OpenAI batch %s ended with status %s", batch.id, batch.status)
+
+            except Exception as e:
+                logger.exception("Failed to generate AI emails via batch: %s", e)
+        elif not self.client:
+            logger.error("OpenAI client not initialized")
+
+        generated_at = datetime.now()
+        records = []
+        for tender_id, custom_id, tender in zip(tender_ids, custom_ids, tender_list, strict=True):
+            email_content = contents.get(custom_id)
+            status = "generated"
+            if not email_content:
+                email_content = self._get_fallback_email(tender)
+                status = "fallback"
+            records.append(
+                {
+                    "tender_id": tender_id,
+                    "subject": self._extract_email_subject(email_content, tender),
+                    "content": email_content,
+                    "generated_at": generated_at.isoformat(),
+                    "status": status,
+                    "ai_model": _select_model(tender) if status == "generated" else _FALLBACK_SOURCE,
+                }
+            )
+
+        try:
+            values = [
+                {
+                    "id": uuid4(),
+                    **self._generated_email_values({**tender, "tender_id": record["tender_id"]}, record),
+                }
+                for tender, record in zip(tender_list, records, strict=True)
+            ]
+            inserted = {row.id: row for row in await self.store_generated_emails_bulk(values)}
+            for row_values, record in zip(values, records, strict=True):
+                row = inserted[row_values["id"]]
+                record["email_id"] = str(row.id)
+                record["generated_at"] = row.generated_at.isoformat()
+
+        except Exception as e:
+            error = f"Storage failed: {e}"
+            logger.exception("Failed to store generated emails: %s", e)
+            for record in records:
+                record["email_id"] = None
+                record["status"] = "generation_only"
+                record["error"] = error
+
+        return records
+
+    async def store_generated_emails_bulk(self, rows: list[dict[str, Any]]) -> list[Any]:
+        """
+        Insert many GeneratedEmail rows with a single INSERT ... RETURNING statement
+
+        The rows are committed together: if the statement fails nothing is stored, there is no
+        per-row failure isolation. Database errors propagate to the caller.
+
+        Args:
+            rows: Dictionaries keyed by GeneratedEmail column names
+
+        Returns:
+            Inserted (id, tender_id, generated_at) rows
+        """
+        if not rows:
+            return []
+
+        stmt = (
+            pg_insert(GeneratedEmail)
+            .values(rows)
+            .returning(GeneratedEmail.id, GeneratedEmail.tender_id, GeneratedEmail.generated_at)
+        )
+        async with get_async_session() as db:
+            result = await db.execute(stmt)
+            inserted = result.all()
+            await db.commit()
+
+        return inserted
+
+    def _generated_email_values(self, tender_data: dict[str, Any], record: dict[str, Any]) -> dict[str, Any]:
+        """Column values of a GeneratedEmail row for a tender and its generated subject/content"""
+        return {
+            "tender_id": record["tender_id"],
+            "email_subject": record["subject"],
+            "email_content": record["content"],
+            "ai_model_used": record["ai_model"],
+            "prompt_version": "v1.0",
+            "contact_info": tender_data.get("contact_info", {}),
+            "tender_info": {
+                "title": tender_data.get("title", ""),
+                "source": tender_data.get("source", ""),
+                "location": tender_data.get("location", ""),
+                "estimated_value": tender_data.get("estimated_value"),
+            },
+            "status": record.get("status", "generated"),
+            "email_metadata": {},
+        }
+
     def _extract_email_subject(self, email_content: str, tender_data: dict[str, Any]) -> str:
         """Extract or generate email subject from content and tender data"""
 
         # Try to find subject in email content (if AI generated one)
-        lines = email_content.split("\n")
-        for line in lines[:3]:  # Check first 3 lines
-            if line.strip().lower().startswith("subject:"):
-                return line.split(":", 1)[1].strip()
+        # Check first 3 lines; maxsplit stops splitting once they are found
+        for line in email_content.split("\n", 3)[:3]:
+            line = line.strip()
+            if line[:8].lower() == "subject:":
+                return line[8:].strip()
 
         # Generate subject based on tender data
         title = tender_data.get("title", "")
@@ -372,18 +1014,14 @@ Email us – our team is ready to assist you!
             List of email records
         """
         try:
-            from sqlalchemy import desc
-
-            from ..database.models import GeneratedEmail, SessionLocal
-
-            db = SessionLocal()
-            try:
-                query = db.query(GeneratedEmail).order_by(desc(GeneratedEmail.generated_at))
+            async with get_async_session() as db:
+                query = select(GeneratedEmail).order_by(desc(GeneratedEmail.generated_at))
 
                 if tender_id:
-                    query = query.filter(GeneratedEmail.tender_id == tender_id)
+                    query = query.where(GeneratedEmail.tender_id == tender_id)
 
-                emails = query.limit(limit).all()
+                result = await db.execute(query.limit(limit))
+                emails = result.scalars().all()
 
                 return [
                     {
@@ -401,9 +1039,6 @@ Email us – our team is ready to assist you!
                     for email in emails
                 ]
 
-            finally:
-                db.close()
-
         except Exception as e:
-            logger.error(f"Failed to retrieve stored emails: {str(e)}")
+            logger.exception("Failed to retrieve stored emails: %s", e)
             return []
@@ -1,13 +1,26 @@
-from datetime import datetime, timedelta
+import asyncio
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import httpx
+import orjson
 from loguru import logger
 
 from ..config import settings
 from ..models.tender_models import TenderData, TenderSource
 
 
+def _parse_api_datetime(value: str) -> datetime:
+    """Parse an API ISO timestamp into the naive UTC datetime used across the tree and the DB
+
+    fromisoformat accepts the API's trailing "Z" natively on Python 3.11+.
+    """
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(UTC).replace(tzinfo=None)
+    return parsed
+
+
 class BuildingConnectedClient:
     """BuildingConnected API Client for tender/bid data"""
 
@@ -19,11 +32,32 @@ class BuildingConnectedClient:
         self.client_secret = settings.autodesk_client_secret
         self.access_token = None
         self.token_expires_at = None
+        self._http_client: httpx.AsyncClient | None = None
 
         logger.info(
             f"BuildingConnected Client initialized - client_id: {self.client_id[:10] if self.client_id else 'None'}..."
         )
 
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP/2 client, creating it on first use.
+
+        Token, listing and per-opportunity detail requests all go to developer.api.autodesk.com,
+        so keeping one connection alive saves a TLS handshake on every call.
+        """
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                timeout=30.0,
+            )
+        return self._http_client
+
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
     async def authenticate(self) -> bool:
         """Authenticate with BuildingConnected API using existing OAuth token or 2-legged fallback"""
         try:
@@ -39,31 +73,30 @@ class BuildingConnectedClient:
 
             # Fallback to 2-legged OAuth for server-to-server auth
             logger.info("Using 2-legged OAuth for BuildingConnected authentication")
-            async with httpx.AsyncClient() as client:
-                auth_data = {
-                    "grant_type": "client_credentials",
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "scope": "data:read data:write",
-                }
-
-                response = await client.post(
-                    self.auth_url,
-                    data=auth_data,
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                    timeout=30.0,
-                )
-
-                if response.status_code == 200:
-                    token_data = response.json()
-                    self.access_token = token_data.get("access_token")
-                    expires_in = token_data.get("expires_in", 3600)
-                    self.token_expires_at = datetime.now() + timedelta(seconds=expires_in)
-                    logger.info("Successfully authenticated with BuildingConnected API")
-                    return True
-                else:
-                    logger.error(f"Authentication failed: {response.status_code} - {response.text}")
-                    return False
+            client = self._get_http_client()
+            auth_data = {
+                "grant_type": "client_credentials",
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "scope": "data:read data:write",
+            }
+
+            response = await client.post(
+                self.auth_url,
+                data=auth_data,
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            )
+
+            if response.status_code == 200:
+                token_data = orjson.loads(response.content)
+                self.access_token = token_data.get("access_token")
+                expires_in = token_data.get("expires_in", 3600)
+                self.token_expires_at = datetime.now() + timedelta(seconds=expires_in)
+                logger.info("Successfully authenticated with BuildingConnected API")
+                return True
+            else:
+                logger.error(f"Authentication failed: {response.status_code} - {response.text}")
+                return False
 
         except Exception as e:
             logger.error(f"Authentication error: {e}")
@@ -81,34 +114,34 @@ class BuildingConnectedClient:
             raise Exception("Failed to authenticate")
 
         try:
-            async with httpx.AsyncClient() as client:
-                headers = {
-                    "Authorization": f"Bearer {self.access_token}",
-                    "Content-Type": "application/json",
-                }
-
-                # Use correct BuildingConnected API endpoint
-                url = f"{self.bc_base_url}/v2/opportunities"
-                logger.info(f"Fetching opportunities from: {url}")
-
-                response = await client.get(url, headers=headers, timeout=30.0)
-                logger.info(f"Response status: {response.status_code}")
-
-                if response.status_code == 200:
-                    data = response.json()
-                    opportunities = data.get("results", data.get("data", []))
-                    logger.info(f"Retrieved {len(opportunities)} opportunities from BuildingConnected")
-                    return opportunities
-                elif response.status_code == 403:
-                    logger.error("BuildingConnected API access forbidden - requires Bid Board Pro subscription")
-                    logger.error("Please upgrade to Bid Board Pro to access opportunities data")
-                    return []
-                elif response.status_code == 401:
-                    logger.error("BuildingConnected authentication failed - please re-authorize")
-                    return []
-                else:
-                    logger.error(f"BuildingConnected API error: {response.status_code} - {response.text}")
-                    return []
+            client = self._get_http_client()
+            headers = {
+                "Authorization": f"Bearer {self.access_token}",
+                "Content-Type": "application/json",
+            }
+
+            # Use correct BuildingConnected API endpoint
+            url = f"{self.bc_base_url}/v2/opportunities"
+            logger.info(f"Fetching opportunities from: {url}")
+
+            response = await client.get(url, headers=headers)
+            logger.info(f"Response status: {response.status_code}")
+
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                opportunities = data.get("results", data.get("data", []))
+                logger.info(f"Retrieved {len(opportunities)} opportunities from BuildingConnected")
+                return opportunities
+            elif response.status_code == 403:
+                logger.error("BuildingConnected API access forbidden - requires Bid Board Pro subscription")
+                logger.error("Please upgrade to Bid Board Pro to access opportunities data")
+                return []
+            elif response.status_code == 401:
+                logger.error("BuildingConnected authentication failed - please re-authorize")
+                return []
+            else:
+                logger.error(f"BuildingConnected API error: {response.status_code} - {response.text}")
+                return []
 
         except Exception as e:
             logger.error(f"Error getting BuildingConnected opportunities: {e}")
@@ -120,25 +153,47 @@ class BuildingConnectedClient:
             raise Exception("Failed to authenticate")
 
         try:
-            async with httpx.AsyncClient() as client:
-                headers = {
-                    "Authorization": f"Bearer {self.access_token}",
-                    "Content-Type": "application/json",
-                }
+            client = self._get_http_client()
+            headers = {
+                "Authorization": f"Bearer {self.access_token}",
+                "Content-Type": "application/json",
+            }
 
-                url = f"{self.bc_base_url}/v2/opportunities/{opportunity_id}"
-                response = await client.get(url, headers=headers, timeout=30.0)
+            url = f"{self.bc_base_url}/v2/opportunities/{opportunity_id}"
+            response = await client.get(url, headers=headers)
 
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    logger.error(f"Failed to get opportunity details: {response.status_code}")
-                    return {}
+            if response.status_code == 200:
+                return orjson.loads(response.content)
+            else:
+                logger.error("Failed to get opportunity details: {}", response.status_code)
+                return {}
 
         except Exception as e:
-            logger.error(f"Error getting opportunity details: {e}")
+            logger.error("Error getting opportunity details: {}", e)
             return {}
 
+    async def get_opportunity_details_many(
+        self, opportunity_ids: list[str], concurrency: int = 10
+    ) -> list[dict[str, Any]]:
+        """Get details for several opportunities concurrently, in opportunity_ids order"""
+        if not await self.ensure_authenticated():
+            raise Exception("Failed to authenticate")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(opportunity_id: str) -> dict[str, Any]:
+            async with semaphore:
+                return await self.get_opportunity_details(opportunity_id)
+
+        results = await asyncio.gather(*(fetch(opp_id) for opp_id in opportunity_ids), return_exceptions=True)
+        details = []
+        for opportunity_id, result in zip(opportunity_ids, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error("Error getting opportunity details for {}: {}", opportunity_id, result)
+                result = {}
+            details.append(result)
+        return details
+
 
 class BuildingConnectedScraper:
     """Scraper for BuildingConnected tender data"""
@@ -146,6 +201,11 @@ class BuildingConnectedScraper:
     def __init__(self):
         self.client = BuildingConnectedClient()
 
+    async def cleanup(self):
+        """Cleanup resources"""
+        logger.info("Cleaning up BuildingConnected Scraper")
+        await self.client.aclose()
+
     async def scrape_buildingconnected_data(self, keywords: list[str], max_results: int = 100) -> list[TenderData]:
         """
         Scrape BuildingConnected for construction tender/bid data
@@ -167,12 +227,15 @@ class BuildingConnectedScraper:
                 return []
 
             all_results = []
+            # Lowercase and deduplicate the keywords once; keywords_found keeps the caller's spelling
+            keywords_by_lower = {keyword.lower(): keyword for keyword in keywords}
+            score_per_match = 1 / len(keywords_by_lower) if keywords_by_lower else 0.0
 
             for opp in opportunities[:max_results]:
                 opp_id = opp.get("id")
                 opp_name = opp.get("name", "Unknown Opportunity")
 
-                logger.info(f"Processing opportunity: {opp_name} ({opp_id})")
+                logger.info("Processing opportunity: {} ({})", opp_name, opp_id)
 
                 # Check if opportunity matches keywords
                 description = opp.get("description", "")
@@ -180,9 +243,11 @@ class BuildingConnectedScraper:
                 combined_text = f"{title} {description}".lower()
 
                 # Check if any keyword matches
-                matched_keywords = [kw for kw in keywords if kw.lower() in combined_text]
+                matched_keywords = [kw for kw_lower, kw in keywords_by_lower.items() if kw_lower in combined_text]
 
                 if matched_keywords or not keywords:  # Include all if no keywords specified
+                    created_at = opp.get("created_at")
+                    bid_date = opp.get("bid_date")
                     # Create tender data
                     tender = TenderData(
                         tender_id=opp_id,
@@ -190,18 +255,12 @@ class BuildingConnectedScraper:
                         description=description or "No description available",
                         source=TenderSource.BUILDING_CONNECTED,
                         source_url=f"https://app.buildingconnected.com/opportunities/{opp_id}" if opp_id else None,
-                        posting_date=datetime.fromisoformat(
-                            opp.get("created_at", datetime.now().isoformat()).replace("Z", "+00:00")
-                        ),
-                        response_deadline=datetime.fromisoformat(
-                            opp.get("bid_date", datetime.now().isoformat()).replace("Z", "+00:00")
-                        )
-                        if opp.get("bid_date")
-                        else None,
+                        posting_date=_parse_api_datetime(created_at) if created_at else datetime.now(),
+                        response_deadline=_parse_api_datetime(bid_date) if bid_date else None,
                         estimated_value=opp.get("estimated_value"),
                         location=opp.get("location", {}).get("address", ""),
                         keywords_found=matched_keywords,
-                        relevance_score=len(matched_keywords) / len(keywords) if keywords else 0.5,
+                        relevance_score=len(matched_keywords) * score_per_match if keywords else 0.5,
                         contact_info={
                             "company": opp.get("owner", {}).get("name", ""),
                             "email": opp.get("owner", {}).get("email", ""),
@@ -210,12 +269,13 @@ class BuildingConnectedScraper:
                             "opportunity_type": opp.get("type", ""),
                             "status": opp.get("status", ""),
                             "trade": opp.get("trade", ""),
-                            "raw_data": opp,
                         },
                     )
+                    if settings.scraper_include_raw_data:
+                        tender.extracted_data["raw_data"] = opp
 
                     all_results.append(tender)
-                    logger.info(f"Added opportunity: {title} with {len(matched_keywords)} keyword matches")
+                    logger.info("Added opportunity: {} with {} keyword matches", title, len(matched_keywords))
 
                     if len(all_results) >= max_results:
                         break
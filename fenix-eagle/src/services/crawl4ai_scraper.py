@@ -1,9 +1,16 @@
-import json
+import asyncio
+import heapq
 import os
+import random
+import re
+import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from functools import cached_property, lru_cache
+from operator import itemgetter
 from typing import Any
-from urllib.parse import urlencode
+from urllib.parse import quote_plus, urlencode, urlsplit
 
 from loguru import logger
 
@@ -17,19 +24,332 @@ except ImportError:
     logger.warning("Crawl4AI not available, using fallback scraping")
     CRAWL4AI_AVAILABLE = False
 
-import aiohttp
-from bs4 import BeautifulSoup
+import httpx
+import orjson
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from pydantic import TypeAdapter, ValidationError
 
 from ..config import settings
 from ..models.tender_models import TenderData, TenderSource
 
 
+# Prefer the C-backed lxml tree builder; html.parser is the pure-Python fallback
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+_TENDER_LIST_ADAPTER = TypeAdapter(list[TenderData])
+
+_OPPORTUNITY_CLASSES = frozenset({"opportunity-item", "search-result", "opp-item"})
+
+
+def _is_opportunity_container(name: str, attrs: dict[str, str]) -> bool:
+    """SoupStrainer filter matching the opportunity container selectors of _parse_html_content"""
+    if attrs.get("data-testid") == "opportunity":
+        return True
+    classes = attrs.get("class")
+    return bool(classes) and not _OPPORTUNITY_CLASSES.isdisjoint(classes.split())
+
+
+_OPPORTUNITY_CONTAINERS = SoupStrainer(_is_opportunity_container)
+
+# Common patterns for SAM.gov solicitation numbers, tried in order
+_SOLICITATION_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"[A-Z0-9]{2,}-[A-Z0-9]{2,}-[A-Z0-9]{2,}",  # Pattern like ABC-123-DEF
+        r"[A-Z]{2,}[0-9]{3,}[A-Z0-9]*",  # Pattern like ABC123456
+        r"Solicitation\s*(?:Number|ID|#):\s*([A-Z0-9\-]{5,})",  # Explicit solicitation labels
+        r"RFP\s*(?:Number|#):\s*([A-Z0-9\-]{5,})",  # RFP numbers
+        r"IFB\s*(?:Number|#):\s*([A-Z0-9\-]{5,})",  # IFB numbers
+        r"([A-Z0-9\-]{10,})",  # Any alphanumeric string of 10+ chars
+    )
+)
+# SAM.gov contact fields and the item keys they may come from, in order of preference
+_CONTACT_FIELDS = (
+    ("email", ("contactEmail", "contact_email", "email")),
+    ("phone", ("contactPhone", "contact_phone", "phone")),
+    ("name", ("contactName", "contact_name", "contact")),
+)
+_EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+_PHONE_RE = re.compile(r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b")
+
+# Relevance scoring terms, shared by every scored row
+_INDUSTRY_TERMS = (
+    "window",
+    "door",
+    "glazing",
+    "fenestration",
+    "curtain wall",
+    "storefront",
+)
+_DOB_TERM_BOOSTS = (
+    ("window", 0.4),
+    ("door", 0.3),
+    ("glazing", 0.5),
+    ("glass", 0.3),
+    ("storefront", 0.5),
+    ("curtain wall", 0.5),
+    ("facade", 0.4),
+    ("fenestration", 0.5),
+    ("renovation", 0.3),
+    ("alteration", 0.3),
+    ("interior", 0.2),
+    ("construction", 0.2),
+    ("installation", 0.3),
+    ("replacement", 0.3),
+    ("repair", 0.2),
+    ("modification", 0.2),
+)
+_DOB_PENALTY_TERMS = (
+    "plumbing",
+    "electrical",
+    "hvac",
+    "roofing",
+    "demolition",
+    "sidewalk",
+    "scaffold",
+    "sprinkler",
+    "elevator",
+    "boiler",
+)
+
+# Decoded API responses are reused for identical requests (same URL and query parameters)
+_RESPONSE_CACHE_MAXSIZE = 1024
+_API_RESPONSE_TTL = 600  # seconds, SAM.gov and Shovels AI
+_NYC_DOB_RESPONSE_TTL = 3600  # seconds, the DOB dataset is refreshed daily
+_CRAWL_RESULT_TTL = 1800  # seconds, LLM extractions of SAM.gov and Construction.com pages
+
+# Outbound API concurrency per host, so bursts queue here instead of tripping upstream rate limits
+_HOST_CONCURRENCY = {"sam.gov": 4, "data.cityofnewyork.us": 4, "api.shovels.ai": 2}
+_DEFAULT_HOST_CONCURRENCY = 4
+_MAX_API_RETRIES = 3
+_SAM_GOV_PAGE_SIZE = 100  # SAM.gov API limit per request
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@lru_cache(maxsize=64)
+def _lowercase_keywords(keywords: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+    """(keyword, lowercased keyword) pairs; a scrape reuses the same keywords for every item"""
+    return tuple((keyword, keyword.lower()) for keyword in keywords)
+
+
+# Listings mostly reappear unchanged between polling runs, so their scores are memoized
+@lru_cache(maxsize=4096)
+def _keywords_in_text(text: str, keywords: tuple[str, ...]) -> tuple[str, ...]:
+    """Keywords (original casing) that appear in the text"""
+    text_lower = text.lower()
+    return tuple(keyword for keyword, keyword_lower in _lowercase_keywords(keywords) if keyword_lower in text_lower)
+
+
+def _relevance_score(title: str, description: str, keywords: tuple[str, ...]) -> float:
+    """Relevance score based on keyword matches, see Crawl4AIScraper._calculate_relevance"""
+    return _relevance_and_keywords(title, description, keywords)[0]
+
+
+@lru_cache(maxsize=4096)
+def _relevance_and_keywords(title: str, description: str, keywords: tuple[str, ...]) -> tuple[float, tuple[str, ...]]:
+    """Relevance score plus the keywords found in "{title} {description}", from one scan"""
+    title_lower = title.lower()
+    text = f"{title_lower} {description.lower()}"
+
+    # Base score
+    score = 0.3
+
+    # Keyword matches
+    found = []
+    for keyword, keyword_lower in _lowercase_keywords(keywords):
+        if keyword_lower in text:
+            found.append(keyword)
+            # Title matches are worth more
+            if keyword_lower in title_lower:
+                score += 0.3
+            else:
+                score += 0.2
+
+    # Industry-specific terms boost
+    for term in _INDUSTRY_TERMS:
+        if term in text:
+            score += 0.1
+
+    return min(score, 1.0), tuple(found)  # Cap at 1.0
+
+
+@lru_cache(maxsize=4096)
+def _dob_relevance_score(text: str, keywords: tuple[str, ...]) -> float:
+    """Relevance score for NYC DOB jobs, see Crawl4AIScraper._calculate_dob_relevance"""
+    text_lower = text.lower()
+
+    # Base score for construction work
+    score = 0.2
+
+    # Keyword matches
+    for _, keyword_lower in _lowercase_keywords(keywords):
+        if keyword_lower in text_lower:
+            score += 0.25
+
+    # DOB-specific high-relevance terms
+    for term, boost in _DOB_TERM_BOOSTS:
+        if term in text_lower:
+            score += boost
+
+    # Penalize obviously irrelevant work
+    for term in _DOB_PENALTY_TERMS:
+        if term in text_lower:
+            score -= 0.2
+
+    return max(0.0, min(score, 1.0))
+
+
+def _validate_tenders(records: list[dict[str, Any]], label: str) -> list[TenderData]:
+    """Validate converted rows into TenderData in one pass over the whole batch
+
+    If any row is invalid the batch is re-validated row by row so that only the bad
+    rows are dropped, as when each TenderData was built individually.
+    """
+    try:
+        return _TENDER_LIST_ADAPTER.validate_python(records)
+    except ValidationError:
+        tenders = []
+        for record in records:
+            try:
+                tenders.append(TenderData.model_validate(record))
+            except ValidationError as e:
+                logger.error(f"Error converting {label}: {e}")
+        return tenders
+
+
+def _tender_ids(count: int) -> list[str]:
+    """`count` random version-4 UUID strings drawn from a single os.urandom call"""
+    random_bytes = os.urandom(16 * count)
+    return [str(uuid.UUID(bytes=random_bytes[i : i + 16], version=4)) for i in range(0, 16 * count, 16)]
+
+
+# LLM extraction schemas and instructions, built once instead of on every crawl
+_SAM_GOV_EXTRACTION_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "opportunities": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "title": {"type": "string"},
+                    "description": {"type": "string"},
+                    "solicitation_number": {"type": "string"},
+                    "agency": {"type": "string"},
+                    "office": {"type": "string"},
+                    "posted_date": {"type": "string"},
+                    "response_deadline": {"type": "string"},
+                    "estimated_value": {"type": "string"},
+                    "location": {"type": "string"},
+                    "naics_codes": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                    },
+                    "contact_info": {"type": "string"},
+                    "set_aside": {"type": "string"},
+                    "opportunity_url": {"type": "string"},
+                },
+            },
+        }
+    },
+}
+_SAM_GOV_EXTRACTION_INSTRUCTION = """
+                Extract government contracting opportunities from this page.
+                Focus on opportunities related to construction, windows, doors,
+                glazing, and fenestration.
+                For each opportunity, extract all available details including:
+                - Title and description
+                - Solicitation/opportunity number
+                - Agency and office information
+                - Important dates (posted date, response deadline)
+                - Estimated contract value
+                - Location/place of performance
+                - NAICS codes if available
+                - Contact information
+                - Set-aside information (small business, etc.)
+                - Direct URL to the opportunity
+
+                Return structured data that can be easily processed.
+                """
+
+_CONSTRUCTION_COM_EXTRACTION_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "projects": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "title": {"type": "string"},
+                    "description": {"type": "string"},
+                    "project_id": {"type": "string"},
+                    "owner": {"type": "string"},
+                    "contractor": {"type": "string"},
+                    "architect": {"type": "string"},
+                    "posted_date": {"type": "string"},
+                    "bid_date": {"type": "string"},
+                    "estimated_value": {"type": "string"},
+                    "location": {"type": "string"},
+                    "project_type": {"type": "string"},
+                    "project_stage": {"type": "string"},
+                    "contact_info": {"type": "string"},
+                    "project_url": {"type": "string"},
+                    "specifications": {"type": "string"},
+                },
+            },
+        }
+    },
+}
+_CONSTRUCTION_COM_EXTRACTION_INSTRUCTION = """
+                Extract construction project opportunities from this
+                Construction.com page.
+                Focus on projects that involve windows, doors, glazing,
+                facades, or building envelope work.
+                For each project, extract all available details including:
+                - Project title and description
+                - Project ID or reference number
+                - Owner/client information
+                - General contractor if listed
+                - Architect/engineer information
+                - Important dates (posting date, bid date, start date)
+                - Estimated project value or budget
+                - Location/address of the project
+                - Project type (commercial, residential, institutional, etc.)
+                - Project stage (planning, bidding, construction, etc.)
+                - Contact information for inquiries
+                - Direct URL to the project details
+                - Key specifications related to fenestration/glazing
+
+                Look for keywords like: windows, doors, glazing, curtain wall,
+                storefront,
+                facade, exterior, envelope, fenestration, glass, aluminum, installation.
+
+                Return structured data for easy processing.
+                """
+
+
 class Crawl4AIScraper:
-    """Real Crawl4AI-based scraper for government contracting opportunities"""
+    """Real Crawl4AI-based scraper for government contracting opportunities
+
+    The HTTP/2 client created in initialize() is shared by every API scrape method and keeps
+    connections to SAM.gov, NYC Open Data and Shovels alive between calls; it must outlive all
+    requests and is closed in cleanup().
+    """
 
     def __init__(self):
         self.crawler = None
         self.session = None
+        self._response_cache: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+        # Only the query and date range vary between SAM.gov searches
+        self._sam_gov_url_prefix = (
+            f"https://sam.gov/api/prod/opportunities/v2/search?{urlencode({'api_key': settings.sam_gov_api_key})}"
+        )
 
     async def initialize(self):
         """Initialize the Crawl4AI scraper"""
@@ -45,8 +365,10 @@ class Crawl4AIScraper:
                 self.crawler = None
 
         # Initialize HTTP session for fallback
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
+        self.session = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=75),
+            timeout=30.0,
             headers={
                 "User-Agent": (
                     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -56,12 +378,92 @@ class Crawl4AIScraper:
             },
         )
 
+    @cached_property
+    def _sam_gov_extraction_strategy(self) -> "LLMExtractionStrategy":
+        """Extraction strategy for government contracts, reused across crawls"""
+        return LLMExtractionStrategy(
+            provider="openai/gpt-4o-mini",
+            api_token=settings.openai_api_key,
+            schema=_SAM_GOV_EXTRACTION_SCHEMA,
+            instruction=_SAM_GOV_EXTRACTION_INSTRUCTION,
+        )
+
+    @cached_property
+    def _construction_com_extraction_strategy(self) -> "LLMExtractionStrategy":
+        """Extraction strategy for construction projects, reused across crawls"""
+        return LLMExtractionStrategy(
+            provider="openai/gpt-4o-mini",
+            api_token=settings.openai_api_key,
+            schema=_CONSTRUCTION_COM_EXTRACTION_SCHEMA,
+            instruction=_CONSTRUCTION_COM_EXTRACTION_INSTRUCTION,
+        )
+
     async def cleanup(self):
         """Cleanup resources"""
         if self.crawler:
             await self.crawler.close()
         if self.session:
-            await self.session.close()
+            await self.session.aclose()
+
+    def cache_clear(self):
+        """Drop all cached API responses"""
+        self._response_cache.clear()
+
+    async def _get_json(
+        self,
+        url: str,
+        ttl: float,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> tuple[int, Any]:
+        """GET a JSON API through the shared session, reusing responses younger than ``ttl``
+
+        Returns the status code and the decoded body for 200 responses, or the body text
+        for any other status. Only successful responses are cached. Requests are capped per
+        host and retried with backoff on 429 and 5xx responses.
+        """
+        key = (url, tuple(sorted((params or {}).items())))
+        data = self._cache_get(key, ttl)
+        if data is not None:
+            return 200, data
+
+        host = urlsplit(url).hostname or ""
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._host_semaphores[host] = asyncio.Semaphore(
+                _HOST_CONCURRENCY.get(host, _DEFAULT_HOST_CONCURRENCY)
+            )
+
+        for attempt in range(_MAX_API_RETRIES):
+            async with semaphore:
+                response = await self.session.get(url, params=params, headers=headers)
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                break
+            if response.status_code not in _RETRY_STATUSES or attempt == _MAX_API_RETRIES - 1:
+                return response.status_code, response.text
+
+            # Back off outside the semaphore so queued requests to the host can proceed
+            delay = min(30.0, 2**attempt) + random.uniform(0, 1)
+            logger.warning("{} returned status {}, retrying in {:.1f}s", host, response.status_code, delay)
+            await asyncio.sleep(delay)
+
+        self._cache_put(key, data)
+        return 200, data
+
+    def _cache_get(self, key: tuple, ttl: float) -> Any:
+        """Cached value for ``key`` if it is younger than ``ttl``, else None"""
+        entry = self._response_cache.get(key)
+        if entry is None or time.monotonic() - entry[0] >= ttl:
+            return None
+        self._response_cache.move_to_end(key)
+        return entry[1]
+
+    def _cache_put(self, key: tuple, value: Any) -> None:
+        self._response_cache[key] = (time.monotonic(), value)
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > _RESPONSE_CACHE_MAXSIZE:
+            self._response_cache.popitem(last=False)
 
     async def scrape_sam_gov(self, keywords: list[str], max_results: int = 100) -> list[TenderData]:
         """Scrape SAM.gov for contracting opportunities using API-first approach"""
@@ -72,9 +474,23 @@ class Crawl4AIScraper:
             api_url = self._build_sam_gov_url(keywords, max_results)
             logger.info(f"SAM.gov API URL: {api_url}")
 
+            # Repeated searches within the TTL reuse the parsed tenders and skip the API entirely
+            keywords_per_query = settings.sam_gov_keywords_per_query
+            cache_key = ("sam_gov_tenders", api_url, tuple(keywords), max_results, keywords_per_query)
+            tenders = self._cache_get(cache_key, _API_RESPONSE_TTL)
+            if tenders is not None:
+                logger.info("Reusing {} cached SAM.gov opportunities", len(tenders))
+                # Callers mutate tenders (scores, extracted_data), so never hand out the cached objects
+                return [tender.model_copy(deep=True) for tender in tenders]
+
             # Try direct API access first (fastest and most reliable)
             try:
-                return await self._scrape_sam_gov_api_direct(api_url, keywords)
+                if 0 < keywords_per_query < len(keywords):
+                    tenders = await self._scrape_sam_gov_api_split(keywords, max_results, keywords_per_query)
+                else:
+                    tenders = await self._scrape_sam_gov_api_direct(api_url, keywords, max_results)
+                self._cache_put(cache_key, [tender.model_copy(deep=True) for tender in tenders])
+                return tenders
             except Exception as e:
                 logger.warning(f"Direct API access failed: {e}")
 
@@ -91,6 +507,42 @@ class Crawl4AIScraper:
             # Return empty list instead of mock data
             return []
 
+    async def _scrape_sam_gov_api_split(
+        self, keywords: list[str], max_results: int, keywords_per_query: int
+    ) -> list[TenderData]:
+        """Query SAM.gov concurrently with one OR query per keyword batch and merge the results
+
+        Opportunities returned by several queries are kept once, keyed by solicitation number
+        (or opportunity URL when there is none). Every batch is scored against all keywords.
+        """
+        keyword_batches = [keywords[i : i + keywords_per_query] for i in range(0, len(keywords), keywords_per_query)]
+        results = await asyncio.gather(
+            *(
+                self._scrape_sam_gov_api_direct(self._build_sam_gov_url(batch, max_results), keywords, max_results)
+                for batch in keyword_batches
+            ),
+            return_exceptions=True,
+        )
+
+        failures = [result for result in results if isinstance(result, Exception)]
+        if len(failures) == len(results):
+            raise failures[0]
+
+        seen = set()
+        tenders = []
+        for batch, result in zip(keyword_batches, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning("SAM.gov query for {} failed: {}", batch, result)
+                continue
+            for tender in result:
+                key = tender.extracted_data.get("solicitation_number") or tender.source_url
+                if key not in seen:
+                    seen.add(key)
+                    tenders.append(tender)
+
+        logger.info("Merged {} SAM.gov opportunities from {} queries", len(tenders), len(keyword_batches))
+        return tenders[:max_results]
+
     async def scrape_construction_com(self, keywords: list[str], max_results: int = 100) -> list[TenderData]:
         """Scrape Construction.com using Crawl4AI for construction opportunities"""
         logger.info(f"Starting Construction.com scraping with keywords: {keywords}")
@@ -113,132 +565,109 @@ class Crawl4AIScraper:
 
     def _build_sam_gov_url(self, keywords: list[str], max_results: int) -> str:
         """Build SAM.gov search URL with keywords"""
-        base_url = "https://sam.gov/api/prod/opportunities/v2/search"
-
         # Combine keywords into search query with OR logic for better matches
         query = " OR ".join([f'"{keyword}"' for keyword in keywords])
-
-        params = {
-            "api_key": settings.sam_gov_api_key,
-            "q": query,
-            "size": min(max_results, 100),  # SAM.gov API limit
-            "postedFrom": (datetime.now() - timedelta(days=14)).strftime("%m/%d/%Y"),
-            "postedTo": datetime.now().strftime("%m/%d/%Y"),
-            "ptype": "o",  # Opportunities only
-        }
-
-        return f"{base_url}?{urlencode(params)}"
+        now = datetime.now()
+        posted_from = (now - timedelta(days=14)).strftime("%m/%d/%Y")
+        posted_to = now.strftime("%m/%d/%Y")
+
+        return (
+            f"{self._sam_gov_url_prefix}&q={quote_plus(query)}"
+            f"&size={min(max_results, _SAM_GOV_PAGE_SIZE)}"
+            f"&postedFrom={quote_plus(posted_from)}&postedTo={quote_plus(posted_to)}"
+            "&ptype=o"  # Opportunities only
+        )
 
     def _build_construction_com_url(self, keywords: list[str], max_results: int) -> str:
         """Build Construction.com search URL with keywords"""
-        base_url = "https://www.construction.com/projects"
-
         # Combine keywords for search
         query = " ".join(keywords)
 
-        params = {
-            "q": query,
-            "limit": min(max_results, 50),  # Construction.com reasonable limit
-            "sort": "posted_date",
-            "order": "desc",
-        }
+        return (
+            f"https://www.construction.com/projects?q={quote_plus(query)}"
+            f"&limit={min(max_results, 50)}"  # Construction.com reasonable limit
+            "&sort=posted_date&order=desc"
+        )
 
-        return f"{base_url}?{urlencode(params)}"
+    async def _scrape_sam_gov_api_direct(
+        self, url: str, keywords: list[str], max_results: int = _SAM_GOV_PAGE_SIZE
+    ) -> list[TenderData]:
+        """Direct API access to SAM.gov - fastest method
 
-    async def _scrape_sam_gov_api_direct(self, url: str, keywords: list[str]) -> list[TenderData]:
-        """Direct API access to SAM.gov - fastest method"""
+        The first page reports ``totalRecords``; any further pages up to ``max_results``
+        are fetched concurrently by ``offset``.
+        """
         logger.info("Using direct SAM.gov API access")
 
         try:
-            async with self.session.get(url) as response:
-                if response.status != 200:
-                    raise Exception(f"API returned status {response.status}")
+            status, data = await self._get_json(url, _API_RESPONSE_TTL)
+            if status != 200:
+                raise Exception(f"API returned status {status}")
 
-                content = await response.text()
-                data = json.loads(content)
+            # Check if response is valid
+            if "opportunitiesData" not in data and "results" not in data:
+                raise Exception("Invalid API response structure")
 
-                # Check if response is valid
-                if "opportunitiesData" not in data and "results" not in data:
-                    raise Exception("Invalid API response structure")
+            offsets = range(_SAM_GOV_PAGE_SIZE, min(data.get("totalRecords") or 0, max_results), _SAM_GOV_PAGE_SIZE)
+            if offsets:
+                data = await self._fetch_sam_gov_pages(url, data, offsets)
 
-                results = self._parse_sam_gov_api_response(data, keywords)
-                logger.info(f"Direct API access returned {len(results)} opportunities")
-                return results
+            results = await asyncio.to_thread(self._parse_sam_gov_api_response, data, keywords)
+            logger.info(f"Direct API access returned {len(results)} opportunities")
+            return results[:max_results]
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise Exception(f"Failed to parse API JSON response: {e}") from e
         except Exception as e:
             raise Exception(f"Direct API access error: {e}") from e
 
+    async def _fetch_sam_gov_pages(self, url: str, first_page: dict, offsets: range) -> dict:
+        """Fetch the remaining SAM.gov result pages concurrently and merge them into one response
+
+        Pages go through ``_get_json``, so the per-host limit throttles them. A page that
+        fails is logged and skipped rather than discarding the pages that succeeded.
+        """
+        pages = await asyncio.gather(
+            *(self._get_json(f"{url}&offset={offset}", _API_RESPONSE_TTL) for offset in offsets),
+            return_exceptions=True,
+        )
+
+        records = list(first_page.get("opportunitiesData") or first_page.get("results", []))
+        for offset, page in zip(offsets, pages, strict=True):
+            if isinstance(page, Exception) or page[0] != 200:
+                logger.warning(
+                    "SAM.gov page at offset {} failed: {}", offset, page if isinstance(page, Exception) else page[0]
+                )
+                continue
+            records.extend(page[1].get("opportunitiesData") or page[1].get("results", []))
+
+        logger.info("Fetched {} SAM.gov records across {} pages", len(records), len(offsets) + 1)
+        return {**first_page, "opportunitiesData": records}
+
     async def _scrape_with_crawl4ai(self, url: str, keywords: list[str]) -> list[TenderData]:
         """Scrape using Crawl4AI with AI extraction"""
         logger.info("Using Crawl4AI for intelligent scraping")
 
         try:
-            # Define extraction strategy for government contracts
-            extraction_strategy = LLMExtractionStrategy(
-                provider="openai/gpt-4o-mini",
-                api_token=settings.openai_api_key,
-                schema={
-                    "type": "object",
-                    "properties": {
-                        "opportunities": {
-                            "type": "array",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "title": {"type": "string"},
-                                    "description": {"type": "string"},
-                                    "solicitation_number": {"type": "string"},
-                                    "agency": {"type": "string"},
-                                    "office": {"type": "string"},
-                                    "posted_date": {"type": "string"},
-                                    "response_deadline": {"type": "string"},
-                                    "estimated_value": {"type": "string"},
-                                    "location": {"type": "string"},
-                                    "naics_codes": {
-                                        "type": "array",
-                                        "items": {"type": "string"},
-                                    },
-                                    "contact_info": {"type": "string"},
-                                    "set_aside": {"type": "string"},
-                                    "opportunity_url": {"type": "string"},
-                                },
-                            },
-                        }
-                    },
-                },
-                instruction="""
-                Extract government contracting opportunities from this page.
-                Focus on opportunities related to construction, windows, doors,
-                glazing, and fenestration.
-                For each opportunity, extract all available details including:
-                - Title and description
-                - Solicitation/opportunity number
-                - Agency and office information
-                - Important dates (posted date, response deadline)
-                - Estimated contract value
-                - Location/place of performance
-                - NAICS codes if available
-                - Contact information
-                - Set-aside information (small business, etc.)
-                - Direct URL to the opportunity
-
-                Return structured data that can be easily processed.
-                """,
-            )
+            # LLM extraction is slow and billed per page; reuse a recent extraction of the same page
+            cache_key = ("crawl4ai", url)
+            extracted_data = self._cache_get(cache_key, _CRAWL_RESULT_TTL)
+            if extracted_data is not None:
+                return self._convert_to_tender_data(extracted_data.get("opportunities", []), keywords)
 
-            # Crawl with AI extraction
+            # Crawl with AI extraction, reusing this source's browser session
             result = await self.crawler.run(
                 url=url,
-                extraction_strategy=extraction_strategy,
+                extraction_strategy=self._sam_gov_extraction_strategy,
                 bypass_cache=True,
+                session_id="fenix-sam-gov",
                 js_code="window.scrollTo(0, document.body.scrollHeight);",
                 wait_for="body",
             )
 
             if result.extracted_content:
-                extracted_data = json.loads(result.extracted_content)
+                extracted_data = orjson.loads(result.extracted_content)
+                self._cache_put(cache_key, extracted_data)
                 return self._convert_to_tender_data(extracted_data.get("opportunities", []), keywords)
             else:
                 logger.warning("No content extracted with Crawl4AI")
@@ -254,71 +683,20 @@ class Crawl4AIScraper:
         logger.info("Using Crawl4AI for Construction.com intelligent scraping")
 
         try:
-            # Define extraction strategy for construction projects
-            extraction_strategy = LLMExtractionStrategy(
-                provider="openai/gpt-4o-mini",
-                api_token=settings.openai_api_key,
-                schema={
-                    "type": "object",
-                    "properties": {
-                        "projects": {
-                            "type": "array",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "title": {"type": "string"},
-                                    "description": {"type": "string"},
-                                    "project_id": {"type": "string"},
-                                    "owner": {"type": "string"},
-                                    "contractor": {"type": "string"},
-                                    "architect": {"type": "string"},
-                                    "posted_date": {"type": "string"},
-                                    "bid_date": {"type": "string"},
-                                    "estimated_value": {"type": "string"},
-                                    "location": {"type": "string"},
-                                    "project_type": {"type": "string"},
-                                    "project_stage": {"type": "string"},
-                                    "contact_info": {"type": "string"},
-                                    "project_url": {"type": "string"},
-                                    "specifications": {"type": "string"},
-                                },
-                            },
-                        }
-                    },
-                },
-                instruction="""
-                Extract construction project opportunities from this
-                Construction.com page.
-                Focus on projects that involve windows, doors, glazing,
-                facades, or building envelope work.
-                For each project, extract all available details including:
-                - Project title and description
-                - Project ID or reference number
-                - Owner/client information
-                - General contractor if listed
-                - Architect/engineer information
-                - Important dates (posting date, bid date, start date)
-                - Estimated project value or budget
-                - Location/address of the project
-                - Project type (commercial, residential, institutional, etc.)
-                - Project stage (planning, bidding, construction, etc.)
-                - Contact information for inquiries
-                - Direct URL to the project details
-                - Key specifications related to fenestration/glazing
-
-                Look for keywords like: windows, doors, glazing, curtain wall,
-                storefront,
-                facade, exterior, envelope, fenestration, glass, aluminum, installation.
-
-                Return structured data for easy processing.
-                """,
-            )
+            # LLM extraction is slow and billed per page; reuse a recent extraction of the same page
+            cache_key = ("crawl4ai", url)
+            extracted_data = self._cache_get(cache_key, _CRAWL_RESULT_TTL)
+            if extracted_data is not None:
+                return await asyncio.to_thread(
+                    self._convert_construction_com_to_tender_data, extracted_data.get("projects", []), keywords
+                )
 
-            # Crawl with AI extraction
+            # Crawl with AI extraction, reusing this source's browser session
             result = await self.crawler.run(
                 url=url,
-                extraction_strategy=extraction_strategy,
+                extraction_strategy=self._construction_com_extraction_strategy,
                 bypass_cache=True,
+                session_id="fenix-construction-com",
                 js_code="""
                 // Scroll to load more content
                 window.scrollTo(0, document.body.scrollHeight);
@@ -343,8 +721,11 @@ class Crawl4AIScraper:
             )
 
             if result.extracted_content:
-                extracted_data = json.loads(result.extracted_content)
-                return self._convert_construction_com_to_tender_data(extracted_data.get("projects", []), keywords)
+                extracted_data = orjson.loads(result.extracted_content)
+                self._cache_put(cache_key, extracted_data)
+                return await asyncio.to_thread(
+                    self._convert_construction_com_to_tender_data, extracted_data.get("projects", []), keywords
+                )
             else:
                 logger.warning("No content extracted from Construction.com with Crawl4AI")
                 return []
@@ -375,15 +756,15 @@ class Crawl4AIScraper:
             logger.info(f"NYC DOB API URL: {api_url}")
             logger.info(f"NYC DOB API params: {params}")
 
-            async with self.session.get(api_url, params=params) as response:
-                if response.status != 200:
-                    raise Exception(f"NYC DOB API returned status {response.status}")
+            status, data = await self._get_json(api_url, _NYC_DOB_RESPONSE_TTL, params=params)
+            if status != 200:
+                raise Exception(f"NYC DOB API returned status {status}")
 
-                data = await response.json()
-                logger.info(f"NYC DOB API returned {len(data)} job applications")
+            logger.info(f"NYC DOB API returned {len(data)} job applications")
 
-                # Convert NYC DOB data to TenderData
-                return self._convert_nyc_dob_to_tender_data(data, keywords, max_results)
+            # Convert NYC DOB data to TenderData
+            # Scoring and validation are CPU-bound; keep them off the event loop
+            return await asyncio.to_thread(self._convert_nyc_dob_to_tender_data, data, keywords, max_results)
 
         except Exception as e:
             logger.error(f"NYC DOB API scraping failed: {e}")
@@ -395,19 +776,20 @@ class Crawl4AIScraper:
         """Convert NYC DOB Job Application data to TenderData format"""
         logger.info(f"Converting {len(jobs)} NYC DOB job applications to TenderData")
 
-        tenders = []
+        min_relevance = float(os.getenv("MIN_RELEVANCE_SCORE", "0.3"))
+
+        # Score every job first; TenderData objects are only built for the relevant jobs that
+        # make it into the top max_results, not for the filtered-out majority of the batch
+        candidates = []
         for job in jobs:
             try:
-                # Extract job details
-                job_number = job.get("job__", "")
-                job_type = job.get("job_type", "")
-                job_status = job.get("job_status_descrp", "")
-
                 # Build title from job type and status
+                job_type = job.get("job_type", "")
                 work_type = job.get("work_type", "")
                 title = f"{job_type} Application - {work_type}" if work_type else f"{job_type} Application"
 
                 # Build description from available fields
+                job_status = job.get("job_status_descrp", "")
                 building_type = job.get("building_type", "")
                 description_parts = []
                 if job_status:
@@ -419,6 +801,37 @@ class Crawl4AIScraper:
 
                 description = "\n".join(description_parts)
 
+                # Calculate relevance based on work type and building type
+                full_text = f"{title} {description} {work_type} {building_type}"
+                relevance_score = self._calculate_dob_relevance(full_text, keywords)
+
+            except Exception as e:
+                logger.error(f"Error converting NYC DOB job: {e}")
+                continue
+
+            # Only keep jobs whose relevance score meets the threshold
+            if relevance_score >= min_relevance:
+                candidates.append((relevance_score, job, title, description, full_text))
+
+        # Keep the max_results highest-scoring jobs (highest first); ties keep their batch order
+        candidates = heapq.nlargest(max_results, candidates, key=itemgetter(0))
+
+        # One randomness draw and one clock read for the whole batch
+        tender_ids = _tender_ids(len(candidates))
+        now = datetime.now()
+
+        records = []
+        for tender_id, (relevance_score, job, title, description, full_text) in zip(
+            tender_ids, candidates, strict=True
+        ):
+            try:
+                # Extract job details
+                job_number = job.get("job__", "")
+                job_type = job.get("job_type", "")
+                job_status = job.get("job_status_descrp", "")
+                work_type = job.get("work_type", "")
+                building_type = job.get("building_type", "")
+
                 # Parse dates
                 action_date = self._parse_date(job.get("latest_action_date"))
 
@@ -428,10 +841,6 @@ class Crawl4AIScraper:
                 borough = job.get("borough", "")
                 location = f"{house_no} {street}, {borough}".strip()
 
-                # Calculate relevance based on work type and building type
-                full_text = f"{title} {description} {work_type} {building_type}"
-                relevance_score = self._calculate_dob_relevance(full_text, keywords)
-
                 # Build job URL
                 job_url = f"https://a810-bisweb.nyc.gov/bisweb/JobsQueryByNumberServlet?requestid=1&passjobnumber={job_number}"
 
@@ -442,27 +851,27 @@ class Crawl4AIScraper:
                 applicant_title = job.get("applicant_professional_title", "")
                 applicant_license = job.get("applicant_license__", "")
 
-                tender = TenderData(
-                    id=str(uuid.uuid4()),
-                    title=title or f"DOB Job #{job_number}",
-                    description=description[:1000],
-                    source=TenderSource.NYC_OPEN_DATA,
-                    source_url=job_url,
-                    posting_date=action_date or datetime.now(),
-                    response_deadline=None,  # DOB jobs don't have deadlines
-                    estimated_value=None,  # Not available in this dataset
-                    location=location,
-                    naics_codes=[],
-                    keywords_found=self._find_keywords_in_text(full_text, keywords),
-                    relevance_score=relevance_score,
-                    contact_info={
+                record = {
+                    "id": tender_id,
+                    "title": title or f"DOB Job #{job_number}",
+                    "description": description[:1000],
+                    "source": TenderSource.NYC_OPEN_DATA,
+                    "source_url": job_url,
+                    "posting_date": action_date or now,
+                    "response_deadline": None,  # DOB jobs don't have deadlines
+                    "estimated_value": None,  # Not available in this dataset
+                    "location": location,
+                    "naics_codes": [],
+                    "keywords_found": self._find_keywords_in_text(full_text, keywords),
+                    "relevance_score": relevance_score,
+                    "contact_info": {
                         "applicant_name": applicant_name,
                         "applicant_title": applicant_title,
                         "applicant_license": applicant_license,
                         "borough": borough,
                     },
-                    requirements=[],
-                    extracted_data={
+                    "requirements": [],
+                    "extracted_data": {
                         "job_number": job_number,
                         "job_type": job_type,
                         "job_status": job_status,
@@ -475,23 +884,18 @@ class Crawl4AIScraper:
                         "zoning_dist1": job.get("zoning_dist1", ""),
                         "gis_latitude": job.get("gis_latitude", ""),
                         "gis_longitude": job.get("gis_longitude", ""),
-                        "raw_data": job,
                     },
-                )
-
-                # Only add if relevance score meets threshold
-                min_relevance = float(os.getenv("MIN_RELEVANCE_SCORE", "0.3"))
-                if relevance_score >= min_relevance:
-                    tenders.append(tender)
+                }
+                if settings.scraper_include_raw_data:
+                    record["extracted_data"]["raw_data"] = job
 
             except Exception as e:
                 logger.error(f"Error converting NYC DOB job: {e}")
                 continue
 
-        # Sort by relevance score (highest first) and limit results
-        tenders.sort(key=lambda t: t.relevance_score or 0, reverse=True)
-        result = tenders[:max_results]
+            records.append(record)
 
+        result = _validate_tenders(records, "NYC DOB job")
         logger.info(f"Successfully converted {len(result)} relevant NYC DOB jobs")
         return result
 
@@ -518,8 +922,9 @@ class Crawl4AIScraper:
             # Search parameters for window/door/glazing permits
             # Calculate date range (last 90 days) - use correct field names
             # for broader search
-            end_date = datetime.now().strftime("%Y-%m-%d")
-            start_date = (datetime.now() - timedelta(days=90)).strftime("%Y-%m-%d")
+            now = datetime.now()
+            end_date = now.strftime("%Y-%m-%d")
+            start_date = (now - timedelta(days=90)).strftime("%Y-%m-%d")
 
             params = {
                 "q": search_query,
@@ -535,25 +940,20 @@ class Crawl4AIScraper:
             logger.info(f"Shovels AI API params: {params}")
             logger.info(f"Shovels AI API URL: {api_url}")
 
-            async with self.session.get(api_url, headers=headers, params=params) as response:
-                if response.status == 401:
-                    logger.error("Shovels AI API authentication failed - check API key")
-                    return []
-                elif response.status != 200:
-                    try:
-                        error_text = await response.text()
-                        logger.error(f"Shovels AI API returned status {response.status}: {error_text}")
-                    except Exception as e:
-                        logger.error(f"Shovels AI API returned status {response.status}, error reading response: {e}")
-                    return []
-
-                data = await response.json()
-                permits = data.get("permits", [])
-                logger.info(f"Shovels AI returned {len(permits)} permits")
-                logger.info(f"Shovels AI raw response: {data}")
-
-                # Convert Shovels AI data to TenderData
-                return self._convert_shovels_permits_to_tender_data(permits, keywords)
+            status, data = await self._get_json(api_url, _API_RESPONSE_TTL, params=params, headers=headers)
+            if status == 401:
+                logger.error("Shovels AI API authentication failed - check API key")
+                return []
+            elif status != 200:
+                logger.error(f"Shovels AI API returned status {status}: {data}")
+                return []
+
+            permits = data.get("permits", [])
+            logger.info(f"Shovels AI returned {len(permits)} permits")
+            logger.info(f"Shovels AI raw response: {data}")
+
+            # Convert Shovels AI data to TenderData
+            return await asyncio.to_thread(self._convert_shovels_permits_to_tender_data, permits, keywords)
 
         except Exception as e:
             logger.error(f"Shovels AI API scraping failed: {e}")
@@ -563,8 +963,12 @@ class Crawl4AIScraper:
         """Convert Shovels AI permit data to TenderData format"""
         logger.info(f"Converting {len(permits)} Shovels AI permits to TenderData")
 
-        tenders = []
-        for permit in permits:
+        # One randomness draw and one clock read for the whole batch
+        tender_ids = _tender_ids(len(permits))
+        now = datetime.now()
+
+        records = []
+        for tender_id, permit in zip(tender_ids, permits, strict=True):
             try:
                 # Extract permit details
                 permit_id = permit.get("id", "")
@@ -605,26 +1009,26 @@ class Crawl4AIScraper:
                 # Build permit URL (if available)
                 permit_url = permit.get("url", f"https://api.shovels.ai/permits/{permit_id}")
 
-                tender = TenderData(
-                    id=str(uuid.uuid4()),
-                    title=title or f"Permit #{permit_number}",
-                    description=description[:1000],
-                    source=TenderSource.SHOVELS_AI,
-                    source_url=permit_url,
-                    posting_date=filed_date or datetime.now(),
-                    response_deadline=None,  # Permits don't have deadlines
-                    estimated_value=estimated_value,
-                    location=location,
-                    naics_codes=[],
-                    keywords_found=self._find_keywords_in_text(work_desc, keywords),
-                    relevance_score=relevance_score,
-                    contact_info={
+                record = {
+                    "id": tender_id,
+                    "title": title or f"Permit #{permit_number}",
+                    "description": description[:1000],
+                    "source": TenderSource.SHOVELS_AI,
+                    "source_url": permit_url,
+                    "posting_date": filed_date or now,
+                    "response_deadline": None,  # Permits don't have deadlines
+                    "estimated_value": estimated_value,
+                    "location": location,
+                    "naics_codes": [],
+                    "keywords_found": self._find_keywords_in_text(work_desc, keywords),
+                    "relevance_score": relevance_score,
+                    "contact_info": {
                         "contractor": contractor_name,
                         "contractor_license": contractor_license,
                         "contractor_id": contractor.get("id", ""),
                     },
-                    requirements=[],
-                    extracted_data={
+                    "requirements": [],
+                    "extracted_data": {
                         "permit_id": permit_id,
                         "permit_number": permit_number,
                         "permit_type": permit_type,
@@ -636,18 +1040,20 @@ class Crawl4AIScraper:
                         "inspections": permit.get("inspections", []),
                         "jurisdiction": permit.get("jurisdiction", {}),
                         "geo_id": permit.get("geo_id", ""),
-                        "raw_data": permit,
                     },
-                )
+                }
+                if settings.scraper_include_raw_data:
+                    record["extracted_data"]["raw_data"] = permit
 
                 # Add all permits with window/door/glass keywords
                 if relevance_score > 0.2:
-                    tenders.append(tender)
+                    records.append(record)
 
             except Exception as e:
                 logger.error(f"Error converting Shovels AI permit: {e}")
                 continue
 
+        tenders = _validate_tenders(records, "Shovels AI permit")
         logger.info(f"Successfully converted {len(tenders)} relevant Shovels AI permits")
         return tenders
 
@@ -655,14 +1061,15 @@ class Crawl4AIScraper:
         """Parse SAM.gov API JSON response"""
         logger.info("Parsing SAM.gov API response")
 
-        opportunities = []
+        records = []
 
         # Navigate the API response structure
         results = data.get("opportunitiesData", [])
         if not results:
             results = data.get("results", [])
 
-        for item in results:
+        tender_ids = _tender_ids(len(results))
+        for tender_id, item in zip(tender_ids, results, strict=True):
             try:
                 # Extract opportunity data
                 title = item.get("title", item.get("solicitation_title", "Unknown Title"))
@@ -685,39 +1092,40 @@ class Crawl4AIScraper:
                 else:
                     opportunity_url = "https://sam.gov"
 
-                # Calculate relevance score
-                relevance_score = self._calculate_relevance(title, description, keywords)
-
-                tender = TenderData(
-                    id=str(uuid.uuid4()),
-                    title=title,
-                    description=description[:1000],  # Limit description length
-                    source=TenderSource.SAM_GOV,
-                    source_url=opportunity_url,
-                    posting_date=posted_date,
-                    response_deadline=response_deadline,
-                    estimated_value=self._parse_value(item.get("estimatedValue", item.get("estimated_value"))),
-                    location=self._extract_location(item.get("placeOfPerformance", item.get("location", ""))),
-                    naics_codes=self._extract_naics_codes(item),
-                    keywords_found=self._find_keywords_in_text(title + " " + description, keywords),
-                    relevance_score=relevance_score,
-                    contact_info=self._extract_contact_info(item),
-                    requirements=[],
-                    extracted_data={
+                # Calculate relevance score and the matched keywords
+                relevance_score, keywords_found = self._score_and_find(title, description, keywords)
+
+                record = {
+                    "id": tender_id,
+                    "title": title,
+                    "description": description[:1000],  # Limit description length
+                    "source": TenderSource.SAM_GOV,
+                    "source_url": opportunity_url,
+                    "posting_date": posted_date,
+                    "response_deadline": response_deadline,
+                    "estimated_value": self._parse_value(item.get("estimatedValue", item.get("estimated_value"))),
+                    "location": self._extract_location(item.get("placeOfPerformance", item.get("location", ""))),
+                    "naics_codes": self._extract_naics_codes(item),
+                    "keywords_found": keywords_found,
+                    "relevance_score": relevance_score,
+                    "contact_info": self._extract_contact_info(item),
+                    "requirements": [],
+                    "extracted_data": {
                         "agency": item.get("department", item.get("agency", "")),
                         "office": item.get("subTier", item.get("office", "")),
                         "solicitation_number": solicitation_number,
                         "set_aside": item.get("typeOfSetAside", ""),
                         "raw_data": item,
                     },
-                )
+                }
 
-                opportunities.append(tender)
+                records.append(record)
 
             except Exception as e:
                 logger.error(f"Error parsing opportunity: {e}")
                 continue
 
+        opportunities = _validate_tenders(records, "SAM.gov opportunity")
         logger.info(f"Parsed {len(opportunities)} opportunities from SAM.gov API")
         return opportunities
 
@@ -725,7 +1133,8 @@ class Crawl4AIScraper:
         """Parse HTML content using BeautifulSoup"""
         logger.info("Parsing HTML content")
 
-        soup = BeautifulSoup(html, "html.parser")
+        # Build a tree of only the opportunity containers first; the page chrome around them is skipped
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=_OPPORTUNITY_CONTAINERS)
         opportunities = []
 
         # Look for common opportunity containers
@@ -743,13 +1152,17 @@ class Crawl4AIScraper:
                 break
 
         if not items:
+            # The text search needs the whole document
+            soup = BeautifulSoup(html, HTML_PARSER)
             # Fallback: look for any element containing opportunity-like text
-            items = soup.find_all(
-                text=lambda text: text and any(keyword.lower() in text.lower() for keyword in keywords)
-            )
+            # One case-insensitive regex search per text node instead of a Python check per keyword
+            keyword_re = re.compile("|".join(re.escape(keyword) for keyword in keywords), re.IGNORECASE)
+            items = soup.find_all(string=keyword_re) if keywords else []
             logger.info(f"Fallback: found {len(items)} text matches")
 
-        for item in items[:10]:  # Limit to 10 results
+        items = items[:10]  # Limit to 10 results
+        tender_ids = _tender_ids(len(items))
+        for tender_id, item in zip(tender_ids, items, strict=True):
             try:
                 # Extract text content
                 if hasattr(item, "get_text"):
@@ -765,7 +1178,7 @@ class Crawl4AIScraper:
 
                 # Create basic tender data
                 tender = TenderData(
-                    id=str(uuid.uuid4()),
+                    id=tender_id,
                     title=text[:100] + "..." if len(text) > 100 else text,
                     description=text[:500] + "..." if len(text) > 500 else text,
                     source=TenderSource.SAM_GOV,
@@ -797,19 +1210,16 @@ class Crawl4AIScraper:
             return None
 
         try:
-            # Try different date formats
-            for fmt in [
-                "%Y-%m-%d",
-                "%m/%d/%Y",
-                "%Y-%m-%dT%H:%M:%S",
-                "%Y-%m-%dT%H:%M:%SZ",
-            ]:
-                try:
-                    return datetime.strptime(date_str, fmt)
-                except ValueError:
-                    continue
-            return None
-        except Exception:
+            # Each supported format has a distinguishing character, so only one strptime is attempted
+            if "/" in date_str:
+                fmt = "%m/%d/%Y"
+            elif "T" in date_str or "t" in date_str:
+                fmt = "%Y-%m-%dT%H:%M:%SZ" if date_str[-1] in "Zz" else "%Y-%m-%dT%H:%M:%S"
+            else:
+                fmt = "%Y-%m-%d"
+            return datetime.strptime(date_str, fmt)
+        except (ValueError, TypeError):
+            # Unparseable strings and non-string payload values (e.g. numeric timestamps)
             return None
 
     def _parse_value(self, value_str: str | None) -> float | None:
@@ -840,124 +1250,43 @@ class Crawl4AIScraper:
 
     def _extract_contact_info(self, item: dict) -> dict[str, Any]:
         """Extract contact information"""
-        contact_fields = {
-            "email": ["contactEmail", "contact_email", "email"],
-            "phone": ["contactPhone", "contact_phone", "phone"],
-            "name": ["contactName", "contact_name", "contact"],
-        }
-
         contact_info = {}
-        for field, possible_keys in contact_fields.items():
+        for field, possible_keys in _CONTACT_FIELDS:
             for key in possible_keys:
-                if key in item and item[key]:
-                    contact_info[field] = item[key]
+                value = item.get(key)
+                if value:
+                    contact_info[field] = value
                     break
 
         return contact_info
 
     def _find_keywords_in_text(self, text: str, keywords: list[str]) -> list[str]:
         """Find which keywords appear in the text"""
-        text_lower = text.lower()
-        found = []
-
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                found.append(keyword)
-
-        return found
+        return list(_keywords_in_text(text, tuple(keywords)))
 
     def _calculate_relevance(self, title: str, description: str, keywords: list[str]) -> float:
         """Calculate relevance score based on keyword matches"""
-        text = f"{title} {description}".lower()
-
-        # Base score
-        score = 0.3
+        return _relevance_score(title, description, tuple(keywords))
 
-        # Keyword matches
-        for keyword in keywords:
-            if keyword.lower() in text:
-                # Title matches are worth more
-                if keyword.lower() in title.lower():
-                    score += 0.3
-                else:
-                    score += 0.2
-
-        # Industry-specific terms boost
-        industry_terms = [
-            "window",
-            "door",
-            "glazing",
-            "fenestration",
-            "curtain wall",
-            "storefront",
-        ]
-        for term in industry_terms:
-            if term in text:
-                score += 0.1
-
-        return min(score, 1.0)  # Cap at 1.0
+    def _score_and_find(self, title: str, description: str, keywords: list[str]) -> tuple[float, list[str]]:
+        """Relevance score and the keywords found in title + description, in one pass"""
+        score, found = _relevance_and_keywords(title, description, tuple(keywords))
+        return score, list(found)
 
     def _calculate_dob_relevance(self, text: str, keywords: list[str]) -> float:
         """Calculate relevance score specifically for NYC DOB jobs"""
-        text_lower = text.lower()
-
-        # Base score for construction work
-        score = 0.2
-
-        # Keyword matches
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                score += 0.25
-
-        # DOB-specific high-relevance terms
-        dob_terms = {
-            "window": 0.4,
-            "door": 0.3,
-            "glazing": 0.5,
-            "glass": 0.3,
-            "storefront": 0.5,
-            "curtain wall": 0.5,
-            "facade": 0.4,
-            "fenestration": 0.5,
-            "renovation": 0.3,
-            "alteration": 0.3,
-            "interior": 0.2,
-            "construction": 0.2,
-            "installation": 0.3,
-            "replacement": 0.3,
-            "repair": 0.2,
-            "modification": 0.2,
-        }
-
-        for term, boost in dob_terms.items():
-            if term in text_lower:
-                score += boost
-
-        # Penalize obviously irrelevant work
-        penalty_terms = [
-            "plumbing",
-            "electrical",
-            "hvac",
-            "roofing",
-            "demolition",
-            "sidewalk",
-            "scaffold",
-            "sprinkler",
-            "elevator",
-            "boiler",
-        ]
-        for term in penalty_terms:
-            if term in text_lower:
-                score -= 0.2
-
-        return max(0.0, min(score, 1.0))
+        return _dob_relevance_score(text, tuple(keywords))
 
     def _convert_construction_com_to_tender_data(self, projects: list[dict], keywords: list[str]) -> list[TenderData]:
         """Convert Construction.com project data to TenderData format"""
         logger.info(f"Converting {len(projects)} Construction.com projects to TenderData")
 
+        # One randomness draw and one clock read for the whole batch
+        tender_ids = _tender_ids(len(projects))
+        now = datetime.now()
+
         tenders = []
-        for project in projects:
+        for tender_id, project in zip(tender_ids, projects, strict=True):
             try:
                 # Parse dates
                 posted_date = self._parse_date(project.get("posted_date"))
@@ -984,12 +1313,12 @@ class Crawl4AIScraper:
                 contact_info = self._parse_construction_contact_info(contact_raw)
 
                 tender = TenderData(
-                    id=str(uuid.uuid4()),
+                    id=tender_id,
                     title=title or "Construction Project",
                     description=(description + f"\n\nSpecifications: {specs}")[:1000],
                     source=TenderSource.CONSTRUCTION_COM,
                     source_url=project_url,
-                    posting_date=posted_date or datetime.now(),
+                    posting_date=posted_date or now,
                     response_deadline=bid_date,
                     estimated_value=estimated_value,
                     location=project.get("location", ""),
@@ -1027,18 +1356,14 @@ class Crawl4AIScraper:
             return contact_info
 
         # Try to extract email using regex
-        import re
-
-        email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-        emails = re.findall(email_pattern, contact_raw)
-        if emails:
-            contact_info["email"] = emails[0]
+        email = _EMAIL_RE.search(contact_raw)
+        if email:
+            contact_info["email"] = email.group(0)
 
         # Try to extract phone using regex
-        phone_pattern = r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b"
-        phones = re.findall(phone_pattern, contact_raw)
-        if phones:
-            contact_info["phone"] = phones[0]
+        phone = _PHONE_RE.search(contact_raw)
+        if phone:
+            contact_info["phone"] = phone.group(0)
 
         # Store raw contact info
         contact_info["raw"] = contact_raw.strip()
@@ -1069,19 +1394,26 @@ class Crawl4AIScraper:
         try:
             # If element is a BeautifulSoup element
             if hasattr(element, "find"):
-                # Look for links within the element
-                links = element.find_all("a", href=True)
-                for link in links:
-                    href = link["href"]
-                    if "sam.gov" in href and "/opp/" in href:
-                        # Found a direct SAM.gov opportunity link
-                        if href.startswith("http"):
-                            return href
-                        else:
-                            return f"https://sam.gov{href}" if href.startswith("/") else f"https://sam.gov/{href}"
+                # One walk over the subtree: stop at the first direct SAM.gov opportunity link,
+                # otherwise collect the same text get_text() would return
+                string_types = element.interesting_string_types
+                if isinstance(string_types, type):
+                    string_types = (string_types,)
+                text_parts = []
+                for node in element.descendants:
+                    if isinstance(node, Tag):
+                        href = node.get("href") if node.name == "a" else None
+                        if href and "sam.gov" in href and "/opp/" in href:
+                            # Found a direct SAM.gov opportunity link
+                            if href.startswith("http"):
+                                return href
+                            else:
+                                return f"https://sam.gov{href}" if href.startswith("/") else f"https://sam.gov/{href}"
+                    elif type(node) in string_types:
+                        text_parts.append(node)
 
                 # Look for solicitation numbers in the text or data attributes
-                text_content = element.get_text() if hasattr(element, "get_text") else str(element)
+                text_content = "".join(text_parts)
                 solicitation_match = self._extract_solicitation_number_from_text(text_content)
                 if solicitation_match:
                     # Use search URL as fallback since we don't have the UUID
@@ -1113,20 +1445,8 @@ class Crawl4AIScraper:
 
     def _extract_solicitation_number_from_text(self, text: str) -> str:
         """Extract solicitation number from text using regex patterns"""
-        import re
-
-        # Common patterns for SAM.gov solicitation numbers
-        patterns = [
-            r"[A-Z0-9]{2,}-[A-Z0-9]{2,}-[A-Z0-9]{2,}",  # Pattern like ABC-123-DEF
-            r"[A-Z]{2,}[0-9]{3,}[A-Z0-9]*",  # Pattern like ABC123456
-            r"Solicitation\s*(?:Number|ID|#):\s*([A-Z0-9\-]{5,})",  # Explicit solicitation labels
-            r"RFP\s*(?:Number|#):\s*([A-Z0-9\-]{5,})",  # RFP numbers
-            r"IFB\s*(?:Number|#):\s*([A-Z0-9\-]{5,})",  # IFB numbers
-            r"([A-Z0-9\-]{10,})",  # Any alphanumeric string of 10+ chars
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _SOLICITATION_PATTERNS:
+            match = pattern.search(text)
             if match:
                 # Return the first capture group if it exists, otherwise the whole match
                 return match.group(1) if match.groups() else match.group(0)
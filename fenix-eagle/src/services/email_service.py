@@ -55,8 +55,10 @@ class EmailService:
 
             # Generate email content
             subject = self._generate_subject(tenders, config_name)
-            html_body = await self._generate_html_body(tenders, config_name)
-            text_body = await self._generate_text_body(tenders, config_name)
+            # One AI business email per tender, generated concurrently and shared by both bodies
+            ai_emails = await self.ai_service.generate_many(tenders, screen=True)
+            html_body = self._generate_html_body(tenders, config_name, ai_emails)
+            text_body = self._generate_text_body(tenders, config_name, ai_emails)
 
             # Send email
             success = await self._send_email(
@@ -106,14 +108,8 @@ class EmailService:
         else:
             return f"🔥 {count} nových nabídek oken/dveří ({config_name})"
 
-    async def _generate_html_body(self, tenders: list[dict[str, Any]], config_name: str) -> str:
+    def _generate_html_body(self, tenders: list[dict[str, Any]], config_name: str, ai_emails: list[str]) -> str:
         """Generate HTML email body with data overview and AI-generated emails"""
-        # Generate AI business emails for each tender
-        ai_emails = []
-        for tender in tenders:
-            ai_email = await self.ai_service.generate_business_email(tender)
-            ai_emails.append(ai_email)
-
         template_str = """
         <!DOCTYPE html>
         <html>
@@ -367,14 +363,8 @@ class EmailService:
             timestamp=datetime.now().strftime("%d.%m.%Y %H:%M"),
         )
 
-    async def _generate_text_body(self, tenders: list[dict[str, Any]], config_name: str) -> str:
+    def _generate_text_body(self, tenders: list[dict[str, Any]], config_name: str, ai_emails: list[str]) -> str:
         """Generate plain text email body with data overview and AI-generated business emails"""
-        # Generate AI business emails for each tender
-        ai_emails = []
-        for tender in tenders:
-            ai_email = await self.ai_service.generate_business_email(tender)
-            ai_emails.append(ai_email)
-
         lines = []
         lines.append("FENIX - Nové příležitosti")
         lines.append("=" * 50)
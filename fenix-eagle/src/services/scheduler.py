@@ -7,6 +7,7 @@ from celery.schedules import crontab
 
 from ..config import settings
 from ..database.models import MonitoringConfig, ScanLog, get_db
+from .ai_service import AIService
 from .deduplication_service import DeduplicationService
 from .email_service import EmailService
 from .http_client_service import EagleServiceClient
@@ -58,7 +59,11 @@ def daily_tender_scan(self):
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
 
-        result = loop.run_until_complete(_daily_tender_scan_async())
+        try:
+            result = loop.run_until_complete(_daily_tender_scan_async())
+        finally:
+            # The OpenAI transport is bound to this loop; close it before the loop is discarded
+            loop.run_until_complete(AIService.close_http_client())
 
         logger.info(f"Daily tender scan completed: {result}")
         return result
@@ -419,7 +424,10 @@ def manual_tender_scan(config_name: str = None):
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
 
-        result = loop.run_until_complete(_daily_tender_scan_async(scan_type="manual", triggered_by="api"))
+        try:
+            result = loop.run_until_complete(_daily_tender_scan_async(scan_type="manual", triggered_by="api"))
+        finally:
+            loop.run_until_complete(AIService.close_http_client())
 
         logger.info(f"Manual scan completed: {result}")
         return result
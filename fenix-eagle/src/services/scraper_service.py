@@ -58,6 +58,10 @@ class ScraperService:
         if self.acc_scraper:
             await self.acc_scraper.cleanup()
 
+        # Cleanup BuildingConnected scraper
+        if self.buildingconnected_scraper:
+            await self.buildingconnected_scraper.cleanup()
+
         # Cleanup Poptavky.cz scraper
         if self.poptavky_cz_scraper:
             await self.poptavky_cz_scraper.cleanup()
@@ -0,0 +1,57 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+from src.services.acc_scraper import ACCClient
+
+
+class ProjectsCacheTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = ACCClient()
+        self.client.account_id = "account-1"
+        self.client.access_token = "token-1"
+        self.client.token_expires_at = datetime.now() + timedelta(hours=1)
+        self.fetched = []
+
+        async def fetch_projects():
+            self.fetched.append((self.client.account_id, self.client.access_token))
+            return [{"id": f"project-{len(self.fetched)}"}]
+
+        self.client._fetch_projects = fetch_projects
+
+    async def test_same_identity_reuses_projects(self):
+        first = await self.client.get_projects()
+        second = await self.client.get_projects()
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.fetched), 1)
+
+    async def test_new_access_token_fetches_afresh(self):
+        await self.client.get_projects()
+        self.client.access_token = "token-2"
+        projects = await self.client.get_projects()
+        self.assertEqual(projects, [{"id": "project-2"}])
+        self.assertEqual(self.fetched, [("account-1", "token-1"), ("account-1", "token-2")])
+
+    async def test_new_account_fetches_afresh(self):
+        await self.client.get_projects()
+        self.client.account_id = "account-2"
+        await self.client.get_projects()
+        self.assertEqual(len(self.fetched), 2)
+
+    async def test_expired_entry_fetches_afresh(self):
+        with mock.patch("src.services.acc_scraper.time.monotonic", return_value=1000.0):
+            await self.client.get_projects()
+        with mock.patch("src.services.acc_scraper.time.monotonic", return_value=1000.0 + 3600):
+            await self.client.get_projects()
+        self.assertEqual(len(self.fetched), 2)
+
+    async def test_failed_authentication_raises(self):
+        self.client.access_token = None
+        with mock.patch.object(self.client, "authenticate", return_value=False):
+            with self.assertRaisesRegex(Exception, "Failed to authenticate"):
+                await self.client.get_projects()
+        self.assertEqual(self.fetched, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,246 @@
+import json
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest import mock
+
+from src.config import settings
+from src.services.ai_service import AIService, _PromptCache, _select_model, _TTLCache
+
+
+TENDER = {
+    "tender_id": "tender-1",
+    "title": "Window replacement - City Library",
+    "location": "New York, NY",
+    "source": "sam_gov",
+    "estimated_value": 50000,
+    "response_deadline": "2026-11-01",
+    "contact_info": {"name": "Jane Doe", "email": "jane.doe@example.gov"},
+    "description": "Replace 40 aluminium windows in the municipal library with energy efficient tilt and turn units",
+    "keywords_found": ["window", "replacement"],
+}
+
+
+def _client_property(client):
+    return mock.patch.object(AIService, "client", new_callable=mock.PropertyMock, return_value=client)
+
+
+class TTLCacheTest(unittest.TestCase):
+    def test_entry_expires_after_ttl(self):
+        cache = _TTLCache(maxsize=8, ttl=60)
+        with mock.patch("src.services.ai_service.time.monotonic", return_value=1000.0):
+            cache.set("key", "value")
+        with mock.patch("src.services.ai_service.time.monotonic", return_value=1059.0):
+            self.assertEqual(cache.get("key"), "value")
+        with mock.patch("src.services.ai_service.time.monotonic", return_value=1060.0):
+            self.assertIsNone(cache.get("key"))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = _TTLCache(maxsize=2, ttl=60)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        self.assertEqual(cache.set("c", "3"), "b")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), "1")
+
+
+class PromptCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.service = AIService()
+        self.cache = _PromptCache(maxsize=16, ttl=3600, threshold=0.9)
+
+    def _entry(self, tender):
+        params = self.service._completion_params(tender)
+        return (
+            self.service._cache_key(params),
+            self.service._similarity_anchor(tender, params["model"]),
+            self.service._similarity_text(params),
+        )
+
+    def _store(self, tender, email):
+        self.cache.put(*self._entry(tender), email)
+
+    def test_identical_prompt_hits(self):
+        self._store(TENDER, "email")
+        self.assertEqual(self.cache.lookup(*self._entry(TENDER)), "email")
+
+    def test_near_duplicate_prompt_hits(self):
+        self._store(TENDER, "email")
+        rescraped = {**TENDER, "keywords_found": ["window", "replacement", "glazing"]}
+        self.assertEqual(self.cache.lookup(*self._entry(rescraped)), "email")
+
+    def test_different_description_misses(self):
+        self._store(TENDER, "email")
+        other = {
+            **TENDER,
+            "description": "Resurface the parking lot asphalt, restripe lanes and repair curbs and storm drains",
+            "keywords_found": ["paving"],
+        }
+        self.assertIsNone(self.cache.lookup(*self._entry(other)))
+
+    def test_different_value_or_source_misses(self):
+        self._store(TENDER, "email")
+        self.assertIsNone(self.cache.lookup(*self._entry({**TENDER, "estimated_value": 2_500_000})))
+        self.assertIsNone(self.cache.lookup(*self._entry({**TENDER, "source": "nyc_open_data"})))
+
+    def test_expired_entry_misses(self):
+        with mock.patch("src.services.ai_service.time.monotonic", return_value=1000.0):
+            self._store(TENDER, "email")
+        with mock.patch("src.services.ai_service.time.monotonic", return_value=1000.0 + 3600):
+            self.assertIsNone(self.cache.lookup(*self._entry(TENDER)))
+
+
+class _FakeStream:
+    """Chat completion stream yielding one delta per text, recording the free semaphore slots"""
+
+    def __init__(self, texts, fail_after=None):
+        self.texts = texts
+        self.fail_after = fail_after
+        self.free_slots = []
+        self.close = mock.AsyncMock()
+
+    async def __aiter__(self):
+        for index, text in enumerate(self.texts):
+            if index == self.fail_after:
+                raise RuntimeError("connection reset")
+            self.free_slots.append(AIService._loop_semaphore()._value)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+
+class StreamEmailTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.service = AIService()
+        self.service._store_business_email = mock.AsyncMock()
+        self.client = mock.MagicMock()
+        patches = [
+            _client_property(self.client),
+            mock.patch.object(AIService, "_email_cache", _PromptCache(maxsize=16, ttl=3600, threshold=0.9)),
+            mock.patch.object(AIService._rate_limiter, "acquire", mock.AsyncMock()),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def _stream(self, texts, fail_after=None):
+        stream = _FakeStream(texts, fail_after)
+        self.client.chat.completions.create = mock.AsyncMock(return_value=stream)
+        return stream
+
+    async def _collect(self, **kwargs):
+        return [chunk async for chunk in self.service.generate_business_email_stream(TENDER, **kwargs)]
+
+    async def test_completed_stream_is_stored_and_cached(self):
+        stream = self._stream(["Dear ", "Jane", ", hello "])
+        chunks = await self._collect()
+
+        self.assertEqual("".join(chunks), "Dear Jane, hello ")
+        self.assertEqual(stream.free_slots, [settings.openai_max_concurrency - 1] * 3)
+        stream.close.assert_awaited_once()
+        self.service._store_business_email.assert_awaited_once_with(TENDER, "Dear Jane, hello", _select_model(TENDER))
+
+        # A repeated prompt is served from the cache and stored with the original model
+        self.service._store_business_email.reset_mock()
+        self.assertEqual(await self._collect(), ["Dear Jane, hello"])
+        self.client.chat.completions.create.assert_awaited_once()
+        self.service._store_business_email.assert_awaited_once_with(TENDER, "Dear Jane, hello", _select_model(TENDER))
+
+    async def test_small_deltas_are_coalesced_after_the_first(self):
+        self._stream(["D", "e", "a", "r", " Jane"])
+        self.assertEqual(await self._collect(min_chunk_chars=3), ["D", "ear", " Jane"])
+
+    async def test_disconnect_closes_stream_without_storing(self):
+        stream = self._stream(["Dear ", "Jane"])
+        generator = self.service.generate_business_email_stream(TENDER)
+        self.assertEqual(await anext(generator), "Dear ")
+        await generator.aclose()
+
+        stream.close.assert_awaited_once()
+        self.service._store_business_email.assert_not_awaited()
+        self.assertEqual(AIService._loop_semaphore()._value, settings.openai_max_concurrency)
+
+    async def test_failure_before_first_chunk_yields_and_stores_fallback(self):
+        stream = self._stream(["Dear "], fail_after=0)
+        fallback = self.service._get_fallback_email(TENDER)
+
+        self.assertEqual(await self._collect(), [fallback])
+        stream.close.assert_awaited_once()
+        self.service._store_business_email.assert_awaited_once_with(TENDER, fallback, "fallback")
+
+    async def test_failure_mid_stream_is_not_stored(self):
+        self._stream(["Dear ", "Jane"], fail_after=1)
+        self.assertEqual(await self._collect(), ["Dear "])
+        self.service._store_business_email.assert_not_awaited()
+
+
+class BatchEmailTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.service = AIService()
+        self.client = mock.MagicMock()
+        self.client.files.create = mock.AsyncMock(return_value=SimpleNamespace(id="input-file"))
+        self.client.batches.create = mock.AsyncMock(
+            return_value=SimpleNamespace(id="batch-1", status="completed", output_file_id="output-file")
+        )
+        self.stored = []
+
+        async def store_bulk(rows):
+            self.stored.extend(rows)
+            return [SimpleNamespace(id=row["id"], generated_at=datetime(2026, 10, 1)) for row in rows]
+
+        self.service.store_generated_emails_bulk = store_bulk
+
+    def _submitted_lines(self):
+        content = self.client.files.create.call_args.kwargs["file"][1]
+        return [json.loads(line) for line in content.decode("utf-8").splitlines()]
+
+    def _answer(self, custom_ids):
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": custom_id,
+                    "response": {
+                        "status_code": 200,
+                        "body": {"choices": [{"message": {"content": f" Email for {custom_id} "}}]},
+                    },
+                }
+            )
+            for custom_id in custom_ids
+        ]
+        self.client.files.content = mock.AsyncMock(return_value=SimpleNamespace(text="\n".join(lines)))
+
+    async def test_duplicate_tenders_get_unique_custom_ids(self):
+        self._answer(["tender-1-0", "tender-1-1"])
+        with _client_property(self.client):
+            records = await self.service.generate_business_emails_batch([TENDER, TENDER])
+
+        custom_ids = [line["custom_id"] for line in self._submitted_lines()]
+        self.assertEqual(len(set(custom_ids)), 2)
+        self.assertEqual([record["content"] for record in records], ["Email for tender-1-0", "Email for tender-1-1"])
+        self.assertEqual([record["tender_id"] for record in records], ["tender-1", "tender-1"])
+
+    async def test_missing_output_falls_back_with_distinct_status(self):
+        other = {**TENDER, "tender_id": "tender-2"}
+        self._answer(["tender-1-0"])
+        with _client_property(self.client):
+            records = await self.service.generate_business_emails_batch([TENDER, other])
+
+        self.assertEqual([record["status"] for record in records], ["generated", "fallback"])
+        self.assertEqual(records[0]["ai_model"], _select_model(TENDER))
+        self.assertEqual(records[1]["ai_model"], "fallback")
+        self.assertEqual(records[1]["content"], self.service._get_fallback_email(other))
+        self.assertEqual([row["status"] for row in self.stored], ["generated", "fallback"])
+        self.assertTrue(all(record["email_id"] for record in records))
+
+    async def test_failed_storage_returns_generation_only(self):
+        self._answer(["tender-1-0"])
+        self.service.store_generated_emails_bulk = mock.AsyncMock(side_effect=RuntimeError("database down"))
+        with _client_property(self.client):
+            records = await self.service.generate_business_emails_batch([TENDER])
+
+        self.assertEqual(records[0]["status"], "generation_only")
+        self.assertIsNone(records[0]["email_id"])
+        self.assertIn("database down", records[0]["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
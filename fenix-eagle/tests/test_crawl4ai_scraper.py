@@ -0,0 +1,166 @@
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from src.models.tender_models import TenderData, TenderSource
+from src.services.crawl4ai_scraper import (
+    Crawl4AIScraper,
+    _dob_relevance_score,
+    _keywords_in_text,
+    _relevance_and_keywords,
+    _validate_tenders,
+)
+
+
+def _sam_gov_page(offset, count, total):
+    return {
+        "totalRecords": total,
+        "opportunitiesData": [
+            {
+                "noticeId": f"notice-{offset + i}",
+                "solicitationNumber": f"SOL-{offset + i}",
+                "title": "Window replacement",
+                "postedDate": "2026-10-01",
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def _tender(solicitation_number):
+    return TenderData(
+        title="Window replacement",
+        description="",
+        source=TenderSource.SAM_GOV,
+        source_url=f"https://sam.gov/opp/{solicitation_number}/view",
+        posting_date=datetime(2026, 10, 1),
+        extracted_data={"solicitation_number": solicitation_number},
+    )
+
+
+class ValidateTendersTest(unittest.TestCase):
+    def test_invalid_row_is_dropped_and_valid_rows_kept(self):
+        valid = {
+            "title": "Window replacement",
+            "description": "",
+            "source": TenderSource.SAM_GOV,
+            "source_url": "https://sam.gov",
+            "posting_date": datetime(2026, 10, 1),
+        }
+        tenders = _validate_tenders([valid, {**valid, "posting_date": None}, valid], "test row")
+        self.assertEqual(len(tenders), 2)
+        self.assertTrue(all(isinstance(tender, TenderData) for tender in tenders))
+
+    def test_valid_batch_is_validated_at_once(self):
+        valid = {
+            "title": "Window replacement",
+            "description": "",
+            "source": TenderSource.NYC_OPEN_DATA,
+            "source_url": "https://data.cityofnewyork.us",
+            "posting_date": datetime(2026, 10, 1),
+        }
+        tenders = _validate_tenders([valid] * 3, "test row")
+        self.assertEqual([tender.source for tender in tenders], [TenderSource.NYC_OPEN_DATA] * 3)
+
+
+class KeywordScoringTest(unittest.TestCase):
+    def setUp(self):
+        self.scraper = Crawl4AIScraper()
+        for function in (_keywords_in_text, _relevance_and_keywords, _dob_relevance_score):
+            function.cache_clear()
+
+    def test_keywords_keep_original_casing_and_order(self):
+        found = self.scraper._find_keywords_in_text("New WINDOW and Door units", ["Door", "window", "roof"])
+        self.assertEqual(found, ["Door", "window"])
+
+    def test_repeated_text_is_served_from_cache(self):
+        first = self.scraper._find_keywords_in_text("Window replacement", ["window"])
+        first.append("mutated")
+        second = self.scraper._find_keywords_in_text("Window replacement", ["window"])
+        self.assertEqual(second, ["window"])
+        self.assertEqual(_keywords_in_text.cache_info().hits, 1)
+
+    def test_relevance_score(self):
+        score = self.scraper._calculate_relevance("Window replacement", "City library", ["window", "library"])
+        self.assertAlmostEqual(score, 0.9)
+        self.assertAlmostEqual(self.scraper._calculate_relevance("Window", "", ["window"]), 0.7)
+        self.assertEqual(_relevance_and_keywords.cache_info().misses, 2)
+        self.assertEqual(self.scraper._calculate_relevance("Window door glazing", "", ["window", "door"]), 1.0)
+
+    def test_dob_relevance_score(self):
+        self.assertAlmostEqual(self.scraper._calculate_dob_relevance("Replace windows, plumbing", ["window"]), 0.65)
+        self.assertEqual(self.scraper._calculate_dob_relevance("Plumbing and boiler", []), 0.0)
+        self.scraper._calculate_dob_relevance("Replace windows, plumbing", ["window"])
+        self.assertEqual(_dob_relevance_score.cache_info().hits, 1)
+
+
+class ParseDateTest(unittest.TestCase):
+    def setUp(self):
+        self.scraper = Crawl4AIScraper()
+
+    def test_supported_formats(self):
+        self.assertEqual(self.scraper._parse_date("10/01/2026"), datetime(2026, 10, 1))
+        self.assertEqual(self.scraper._parse_date("2026-10-01"), datetime(2026, 10, 1))
+        self.assertEqual(self.scraper._parse_date("2026-10-01T08:30:00"), datetime(2026, 10, 1, 8, 30))
+        self.assertEqual(self.scraper._parse_date("2026-10-01T08:30:00Z"), datetime(2026, 10, 1, 8, 30))
+
+    def test_unparseable_values_return_none(self):
+        for value in (None, "", "soon", "2026-13-01", "2026-10-01T08:30", 1759300000, 1759300000.0):
+            with self.subTest(value=value):
+                self.assertIsNone(self.scraper._parse_date(value))
+
+
+class SamGovPaginationTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.scraper = Crawl4AIScraper()
+        self.requested = []
+
+        async def get_json(url, ttl, params=None, headers=None):
+            self.requested.append(url)
+            offset = int(url.split("&offset=")[1]) if "&offset=" in url else 0
+            if offset == 200:
+                return 500, "server error"
+            return 200, _sam_gov_page(offset, min(100, 350 - offset), 350)
+
+        self.scraper._get_json = get_json
+
+    async def test_remaining_pages_are_fetched_by_offset(self):
+        tenders = await self.scraper._scrape_sam_gov_api_direct("https://sam.gov/search?q=x", ["window"], 1000)
+        self.assertEqual(len(self.requested), 4)
+        self.assertEqual(sorted(url.rpartition("=")[2] for url in self.requested[1:]), ["100", "200", "300"])
+        # The failed page at offset 200 is skipped, the others are merged
+        self.assertEqual(len(tenders), 250)
+
+    async def test_pages_stop_at_max_results(self):
+        tenders = await self.scraper._scrape_sam_gov_api_direct("https://sam.gov/search?q=x", ["window"], 150)
+        self.assertEqual(len(self.requested), 2)
+        self.assertEqual(len(tenders), 150)
+
+
+class SamGovSplitQueryTest(unittest.IsolatedAsyncioTestCase):
+    async def test_batches_are_merged_without_duplicates(self):
+        scraper = Crawl4AIScraper()
+        results = {"alpha": [_tender("S1"), _tender("S2")], "beta": [_tender("S2"), _tender("S3")]}
+        scored_against = []
+
+        async def direct(url, keywords, max_results):
+            scored_against.append(keywords)
+            if "gamma" in url:
+                raise Exception("query failed")
+            return next(tenders for keyword, tenders in results.items() if keyword in url)
+
+        with mock.patch.object(scraper, "_scrape_sam_gov_api_direct", side_effect=direct):
+            tenders = await scraper._scrape_sam_gov_api_split(["alpha", "beta", "gamma"], 10, 1)
+
+        self.assertEqual([tender.extracted_data["solicitation_number"] for tender in tenders], ["S1", "S2", "S3"])
+        self.assertTrue(all(keywords == ["alpha", "beta", "gamma"] for keywords in scored_against))
+
+    async def test_all_failed_batches_raise(self):
+        scraper = Crawl4AIScraper()
+        with mock.patch.object(scraper, "_scrape_sam_gov_api_direct", side_effect=RuntimeError("query failed")):
+            with self.assertRaisesRegex(RuntimeError, "query failed"):
+                await scraper._scrape_sam_gov_api_split(["alpha", "beta"], 10, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()